@@ -4,13 +4,19 @@ Interactive cybersecurity tool for password analysis, breach checking, and secur
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime
+import base64
+import bisect
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import json
 import sys
 import os
+import uuid
+
+import diskcache
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -27,8 +33,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better styling
-st.markdown("""
+# Static HTML is kept in module constants so each rerun passes the same string
+# object instead of rebuilding it. It is still emitted on every run: Streamlit
+# drops any element that a rerun does not re-emit.
+_CSS = """
 <style>
     .stButton > button {
         width: 100%;
@@ -65,14 +73,151 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+_FOOTER = (
+    "<div style='text-align: center; color: #888; font-size: 16px; padding: 20px; background-color: #f8f9fa; border-radius: 10px; margin-top: 50px;'>"
+    "🔐 <strong>SecurePass Analyzer</strong> | "
+    "💻 Created  by ❤️<strong>Vaibhav Musale</strong><br>"
+    "🎓 Cybersecurity Enthusiast  | 🛡️ Security Analyst<br>"
+    "<a href='mailto:musalevaibhaw@gmail.com' style='color: #4CAF50; text-decoration: none;'>📧 musalevaibhaw@gmail.com</a> | "
+    "<a href='#' style='color: #4CAF50; text-decoration: none;'>🔗 LinkedIn</a> | "
+    "<a href='#' style='color: #4CAF50; text-decoration: none;'>💼 Portfolio</a><br><br>"
+    "<em>✨ Passionate about making cybersecurity accessible to everyone ✨</em>"
+    "</div>"
+)
+
+# Sidebar logo, inlined as a data URI so the sidebar needs no external request
+_LOGO_SVG = (
+    "<svg xmlns='http://www.w3.org/2000/svg' width='150' height='150' viewBox='0 0 150 150'>"
+    "<rect width='150' height='150' rx='20' fill='#4CAF50'/>"
+    "<rect x='50' y='62' width='50' height='40' rx='6' fill='white'/>"
+    "<path d='M60 62 V50 a15 15 0 0 1 30 0 V62' fill='none' stroke='white' stroke-width='8'/>"
+    "<text x='75' y='130' font-family='sans-serif' font-size='18' font-weight='bold' "
+    "fill='white' text-anchor='middle'>SecurePass</text>"
+    "</svg>"
+)
+_LOGO_B64 = base64.b64encode(_LOGO_SVG.encode('utf-8')).decode('ascii')
+_LOGO_HTML = f"<img src='data:image/svg+xml;base64,{_LOGO_B64}' width='150' height='150'>"
+
+# Custom CSS for better styling
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Plotly and pandas are heavy to import, so they are loaded on first use by the
+# pages that need them rather than at startup
+@functools.lru_cache(maxsize=None)
+def _plotly_go():
+    import plotly.graph_objects as go
+    return go
+
+@functools.lru_cache(maxsize=None)
+def _plotly_px():
+    import plotly.express as px
+    return px
+
+@functools.lru_cache(maxsize=None)
+def _pandas():
+    import pandas as pd
+    return pd
+
+# Shared service objects (one instance per server process, not per session)
+@st.cache_resource
+def get_analyzer():
+    return PasswordAnalyzer()
+
+@st.cache_resource
+def get_checker():
+    return BreachChecker()
+
+@st.cache_resource
+def get_generator():
+    return PasswordGenerator()
+
+# Worker pool for blocking analysis and HIBP calls, shared by all sessions
+@st.cache_resource
+def _pool():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# The leading underscore keeps the raw password out of Streamlit's cache key;
+# entries are keyed on its SHA-256 digest only
+@st.cache_data(max_entries=512, ttl=600, show_spinner=False)
+def _analyze_cached(pw_hash, _password):
+    return _pool().submit(get_analyzer().analyze, _password).result()
+
+def analyze_password(password):
+    pw_hash = hashlib.sha256(password.encode('utf-8')).hexdigest()
+    return _analyze_cached(pw_hash, password)
+
+# Maximum number of analyses kept per session
+MAX_HISTORY = 500
+
+# Persisted histories expire after 30 days without new analyses
+HISTORY_TTL = 30 * 24 * 60 * 60
+
+# Cookie holding the random history id; unlike a query parameter it does not
+# leak through copied links, browser history or Referer headers
+HISTORY_COOKIE = 'securepass_history'
+
+@st.cache_resource
+def _history_cache():
+    return diskcache.Cache(
+        os.path.join(os.path.dirname(__file__), '.cache', 'history'),
+        size_limit=50 << 20
+    )
+
+def _issue_history_key():
+    """Create a new history id and queue it for the history cookie"""
+    key = uuid.uuid4().hex
+    st.session_state.history_key = key
+    # Written by _write_pending_history_cookie at the top of a run, so an st.rerun()
+    # right after issuing cannot drop the script before it reaches the browser
+    st.session_state.history_cookie_pending = key
+    return key
+
+def _write_pending_history_cookie():
+    """Send a newly issued history id to the browser's history cookie"""
+    key = st.session_state.pop('history_cookie_pending', None)
+    if key is not None:
+        # Streamlit can read cookies but not set them; the script only embeds our own uuid
+        st.html(
+            f"<script>document.cookie = '{HISTORY_COOKIE}={key}; max-age={HISTORY_TTL}; "
+            f"path=/; SameSite=Strict';</script>",
+            unsafe_allow_javascript=True
+        )
+
+def _history_key():
+    # A random id in a cookie survives page refreshes, unlike the session id
+    if 'history_key' not in st.session_state:
+        key = st.context.cookies.get(HISTORY_COOKIE, '')
+        try:
+            st.session_state.history_key = uuid.UUID(hex=key).hex
+        except ValueError:
+            _issue_history_key()
+    return st.session_state.history_key
+
+def clear_history():
+    """Delete the persisted history and start over under a new history id"""
+    _history_cache().delete(_history_key())
+    st.session_state.analysis_history.clear()
+    _issue_history_key()
+
+def record_analysis(analysis):
+    """Append an analysis summary to the history and persist it"""
+    st.session_state.analysis_history.append({
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'score': analysis['score'],
+        'strength': analysis['strength']
+    })
+    _history_cache().set(_history_key(), st.session_state.analysis_history,
+                         expire=HISTORY_TTL)
 
 # Initialize session state
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = PasswordAnalyzer()
-    st.session_state.checker = BreachChecker()
-    st.session_state.generator = PasswordGenerator()
-    st.session_state.analysis_history = []
+if 'analysis_history' not in st.session_state:
+    st.session_state.analysis_history = (
+        _history_cache().get(_history_key())
+        or collections.deque(maxlen=MAX_HISTORY)
+    )
+_write_pending_history_cookie()
 
 def main():
     # Title and description
@@ -82,7 +227,7 @@ def main():
     
     # Sidebar
     with st.sidebar:
-        st.image("https://via.placeholder.com/150x150.png?text=SecurePass", width=150)
+        st.markdown(_LOGO_HTML, unsafe_allow_html=True)
         st.markdown("## Navigation")
         page = st.radio(
             "Choose a feature:",
@@ -125,18 +270,7 @@ def main():
     
     # Footer with creator information
     st.markdown("---")
-    st.markdown(
-        "<div style='text-align: center; color: #888; font-size: 16px; padding: 20px; background-color: #f8f9fa; border-radius: 10px; margin-top: 50px;'>"
-        "🔐 <strong>SecurePass Analyzer</strong> | "
-        "💻 Created  by ❤️<strong>Vaibhav Musale</strong><br>"
-        "🎓 Cybersecurity Enthusiast  | 🛡️ Security Analyst<br>"
-        "<a href='mailto:musalevaibhaw@gmail.com' style='color: #4CAF50; text-decoration: none;'>📧 musalevaibhaw@gmail.com</a> | "
-        "<a href='#' style='color: #4CAF50; text-decoration: none;'>🔗 LinkedIn</a> | "
-        "<a href='#' style='color: #4CAF50; text-decoration: none;'>💼 Portfolio</a><br><br>"
-        "<em>✨ Passionate about making cybersecurity accessible to everyone ✨</em>"
-        "</div>",
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER, unsafe_allow_html=True)
 
 def password_analyzer_page():
     st.header("🔍 Password Strength Analyzer")
@@ -145,11 +279,14 @@ def password_analyzer_page():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        password = st.text_input(
-            "Enter password to analyze:",
-            type="password",
-            help="Your password is not stored and is only analyzed locally"
-        )
+        # The form defers reruns until submit instead of rerunning on every edit
+        with st.form("analyze_form", clear_on_submit=False):
+            password = st.text_input(
+                "Enter password to analyze:",
+                type="password",
+                help="Your password is not stored and is only analyzed locally"
+            )
+            submitted = st.form_submit_button("Analyze Password", type="primary")
         
         show_password = st.checkbox("Show password")
         if show_password and password:
@@ -166,17 +303,16 @@ def password_analyzer_page():
             else:
                 st.success(f"Length: {length} characters")
     
-    if st.button("Analyze Password", type="primary"):
+    _show_analysis_results(password, submitted)
+
+def _show_analysis_results(password, submitted):
+    if submitted:
         if password:
             with st.spinner("Analyzing password..."):
-                analysis = st.session_state.analyzer.analyze(password)
+                analysis = analyze_password(password)
                 
                 # Store in history
-                st.session_state.analysis_history.append({
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    'score': analysis['score'],
-                    'strength': analysis['strength']
-                })
+                record_analysis(analysis)
                 
                 # Display results
                 st.markdown("---")
@@ -185,30 +321,8 @@ def password_analyzer_page():
                 # Score meter
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
-                    fig = go.Figure(go.Indicator(
-                        mode="gauge+number",
-                        value=analysis['score'],
-                        domain={'x': [0, 1], 'y': [0, 1]},
-                        title={'text': "Security Score"},
-                        gauge={
-                            'axis': {'range': [None, 100]},
-                            'bar': {'color': get_score_color(analysis['score'])},
-                            'steps': [
-                                {'range': [0, 20], 'color': "lightgray"},
-                                {'range': [20, 40], 'color': "lightyellow"},
-                                {'range': [40, 60], 'color': "lightblue"},
-                                {'range': [60, 80], 'color': "lightgreen"},
-                                {'range': [80, 100], 'color': "darkgreen"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "red", 'width': 4},
-                                'thickness': 0.75,
-                                'value': 60
-                            }
-                        }
-                    ))
-                    fig.update_layout(height=300)
-                    st.plotly_chart(fig, use_container_width=True)
+                    fig = build_gauge(analysis['score'])
+                    st.plotly_chart(fig, width="stretch", config=_PLOTLY_CFG)
                 
                 # Strength badge
                 strength_color = get_strength_color(analysis['strength'])
@@ -248,14 +362,13 @@ def password_analyzer_page():
                 # Character diversity
                 st.markdown("### 🔤 Character Diversity")
                 diversity = analysis['character_diversity']
-                diversity_df = pd.DataFrame([
+                st.table([
                     {"Type": "Lowercase", "Present": "✅" if diversity['has_lowercase'] else "❌"},
                     {"Type": "Uppercase", "Present": "✅" if diversity['has_uppercase'] else "❌"},
                     {"Type": "Numbers", "Present": "✅" if diversity['has_numbers'] else "❌"},
                     {"Type": "Symbols", "Present": "✅" if diversity['has_symbols'] else "❌"},
                     {"Type": "Spaces", "Present": "✅" if diversity['has_spaces'] else "❌"}
                 ])
-                st.table(diversity_df)
                 
                 # Patterns detected
                 st.markdown("### 🔍 Pattern Detection")
@@ -263,11 +376,9 @@ def password_analyzer_page():
                 pattern_data = []
                 for pattern, found in patterns.items():
                     status = "⚠️ Detected" if found else "✅ Not found"
-                    pattern_name = pattern.replace('_', ' ').title()
-                    pattern_data.append({"Pattern": pattern_name, "Status": status})
+                    pattern_data.append({"Pattern": _PATTERN_LABELS.get(pattern, pattern), "Status": status})
                 
-                patterns_df = pd.DataFrame(pattern_data)
-                st.table(patterns_df)
+                st.table(pattern_data)
                 
                 # Recommendations
                 st.markdown("### 💡 Recommendations")
@@ -302,7 +413,9 @@ def breach_checker_page():
         if st.button("Check Password Breach"):
             if password_to_check:
                 with st.spinner("Checking against breach databases..."):
-                    is_breached, count = st.session_state.checker.check_password_breach(password_to_check)
+                    is_breached, count = _pool().submit(
+                        get_checker().check_password_breach, password_to_check
+                    ).result()
                     
                     if is_breached:
                         st.error(f"⚠️ **WARNING**: This password has been found in {count:,} data breaches!")
@@ -316,7 +429,7 @@ def breach_checker_page():
                         """)
                         
                         # Risk level visualization
-                        risk_level = st.session_state.checker._calculate_risk_level(is_breached, count)
+                        risk_level = get_checker()._calculate_risk_level(is_breached, count)
                         risk_color = {
                             "Low Risk": "yellow",
                             "Medium Risk": "orange",
@@ -349,7 +462,9 @@ def breach_checker_page():
                     st.error("API key is required for email breach checking. Get one at haveibeenpwned.com/API/Key")
                 else:
                     with st.spinner("Checking email against breach databases..."):
-                        result = st.session_state.checker.check_email_breaches(email, api_key)
+                        result = _pool().submit(
+                            get_checker().check_email_breaches, email, api_key
+                        ).result()
                         
                         if result['error']:
                             st.error(f"Error: {result['error']}")
@@ -378,6 +493,7 @@ def password_generator_page():
     )
     
     generated_password = None
+    batch_options = None
     
     if gen_type == "Random":
         col1, col2 = st.columns(2)
@@ -393,9 +509,17 @@ def password_generator_page():
             exclude_ambiguous = st.checkbox("Exclude ambiguous characters (0, O, l, I)")
             exclude_chars = st.text_input("Exclude specific characters:")
         
+        batch_options = {
+            'length': length,
+            'use_lowercase': use_lowercase,
+            'use_uppercase': use_uppercase,
+            'use_digits': use_digits,
+            'use_symbols': use_symbols
+        }
+        
         if st.button("Generate Random Password"):
             try:
-                generated_password = st.session_state.generator.generate_random(
+                generated_password = get_generator().generate_random(
                     length=length,
                     use_lowercase=use_lowercase,
                     use_uppercase=use_uppercase,
@@ -419,7 +543,7 @@ def password_generator_page():
             capitalize = st.checkbox("Capitalize words", value=True)
         
         if st.button("Generate Memorable Password"):
-            generated_password = st.session_state.generator.generate_memorable(
+            generated_password = get_generator().generate_memorable(
                 word_count=word_count,
                 add_numbers=add_numbers,
                 add_symbols=add_symbols,
@@ -437,7 +561,7 @@ def password_generator_page():
             add_symbols = st.checkbox("Add symbols", value=False)
         
         if st.button("Generate Pronounceable Password"):
-            generated_password = st.session_state.generator.generate_pronounceable(
+            generated_password = get_generator().generate_pronounceable(
                 length=length,
                 add_numbers=add_numbers,
                 add_symbols=add_symbols
@@ -454,7 +578,7 @@ def password_generator_page():
             capitalize_words = st.checkbox("Capitalize words", value=False)
         
         if st.button("Generate Passphrase"):
-            generated_password = st.session_state.generator.generate_passphrase(
+            generated_password = get_generator().generate_passphrase(
                 word_count=word_count,
                 separator=separator,
                 capitalize_words=capitalize_words
@@ -478,58 +602,57 @@ def password_generator_page():
         
         if st.button("Generate from Pattern"):
             try:
-                generated_password = st.session_state.generator.generate_custom_pattern(pattern)
+                generated_password = get_generator().generate_custom_pattern(pattern)
             except Exception as e:
                 st.error(f"Error: {str(e)}")
     
     # Display generated password
     if generated_password:
-        st.markdown("---")
-        st.markdown("### Generated Password")
-        
-        col1, col2 = st.columns([3, 1])
-        
-        with col1:
-            st.code(generated_password, language=None)
-        
-        with col2:
-            if st.button("📋 Copy to Clipboard"):
-                st.write("Password copied!")
-                st.balloons()
-        
-        # Analyze the generated password
-        st.markdown("### Password Analysis")
-        analysis = st.session_state.analyzer.analyze(generated_password)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.metric("Score", f"{analysis['score']}/100")
-        
-        with col2:
-            st.metric("Strength", analysis['strength'])
-        
-        with col3:
-            st.metric("Entropy", f"{analysis['entropy_bits']:.1f} bits")
-        
-        # Batch generation
-        st.markdown("### Batch Generation")
-        batch_count = st.slider("Generate multiple passwords:", 1, 10, 5)
-        
-        if st.button("Generate Batch"):
-            if gen_type == "Random":
-                passwords = st.session_state.generator.batch_generate(
-                    count=batch_count,
-                    length=length if 'length' in locals() else 16,
-                    use_lowercase=use_lowercase if 'use_lowercase' in locals() else True,
-                    use_uppercase=use_uppercase if 'use_uppercase' in locals() else True,
-                    use_digits=use_digits if 'use_digits' in locals() else True,
-                    use_symbols=use_symbols if 'use_symbols' in locals() else True
-                )
-                
-                st.markdown("### Generated Passwords:")
-                for i, pwd in enumerate(passwords, 1):
-                    st.code(f"{i}. {pwd}", language=None)
+        _generator_result_fragment(generated_password, batch_options)
+
+@st.fragment
+def _generator_result_fragment(generated_password, batch_options):
+    st.markdown("---")
+    st.markdown("### Generated Password")
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        st.code(generated_password, language=None)
+    
+    with col2:
+        if st.button("📋 Copy to Clipboard"):
+            st.write("Password copied!")
+            st.balloons()
+    
+    # Analyze the generated password
+    st.markdown("### Password Analysis")
+    analysis = analyze_password(generated_password)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Score", f"{analysis['score']}/100")
+    
+    with col2:
+        st.metric("Strength", analysis['strength'])
+    
+    with col3:
+        st.metric("Entropy", f"{analysis['entropy_bits']:.1f} bits")
+    
+    # Batch generation
+    st.markdown("### Batch Generation")
+    batch_count = st.slider("Generate multiple passwords:", 1, 10, 5)
+    
+    if st.button("Generate Batch"):
+        if batch_options is not None:
+            passwords = get_generator().batch_generate(count=batch_count, **batch_options)
+            analyses = get_analyzer().batch_analyze(passwords, executor=_pool())
+            
+            st.markdown("### Generated Passwords:")
+            for i, (pwd, pwd_analysis) in enumerate(zip(passwords, analyses), 1):
+                st.code(f"{i}. {pwd}", language=None)
+                st.caption(f"{pwd_analysis['strength']} · {pwd_analysis['score']}/100")
 
 def security_dashboard_page():
     st.header("📊 Security Dashboard")
@@ -540,7 +663,10 @@ def security_dashboard_page():
         return
     
     # Convert history to DataFrame
-    df = pd.DataFrame(st.session_state.analysis_history)
+    pd = _pandas()
+    df = pd.DataFrame(list(st.session_state.analysis_history))
+    df['strength'] = pd.Categorical(df['strength'], categories=STRENGTH_LEVELS)
+    strength_counts = df['strength'].value_counts()
     
     # Summary statistics
     col1, col2, col3, col4 = st.columns(4)
@@ -553,33 +679,32 @@ def security_dashboard_page():
         st.metric("Average Score", f"{avg_score:.1f}")
     
     with col3:
-        strong_count = len(df[df['strength'].isin(['Strong', 'Very Strong'])])
+        strong_count = int(strength_counts['Strong'] + strength_counts['Very Strong'])
         st.metric("Strong Passwords", strong_count)
     
     with col4:
-        weak_count = len(df[df['strength'].isin(['Weak', 'Very Weak'])])
+        weak_count = int(strength_counts['Weak'] + strength_counts['Very Weak'])
         st.metric("Weak Passwords", weak_count)
     
+    # Charts sit in collapsed expanders with on_change="rerun", so their
+    # contents only run (and figures are only built) once the user opens them
+    
     # Score trend over time
-    st.markdown("### Score Trend")
-    fig = px.line(df, x='timestamp', y='score', title='Password Score Over Time',
-                  markers=True, line_shape='spline')
-    fig.update_layout(yaxis_range=[0, 100])
-    st.plotly_chart(fig, use_container_width=True)
+    trend_expander = st.expander("📈 Score Trend Over Time", expanded=False,
+                                 key="trend_expander", on_change="rerun")
+    if trend_expander.open:
+        with trend_expander:
+            history = tuple(tuple(entry.items()) for entry in st.session_state.analysis_history)
+            fig = build_score_trend(history)
+            st.plotly_chart(fig, width="stretch", config=_PLOTLY_CFG)
     
     # Strength distribution
-    st.markdown("### Strength Distribution")
-    strength_counts = df['strength'].value_counts()
-    fig = px.pie(values=strength_counts.values, names=strength_counts.index,
-                 title='Password Strength Distribution',
-                 color_discrete_map={
-                     'Very Strong': '#00CC00',
-                     'Strong': '#66FF66',
-                     'Moderate': '#FFFF00',
-                     'Weak': '#FF9900',
-                     'Very Weak': '#FF0000'
-                 })
-    st.plotly_chart(fig, use_container_width=True)
+    pie_expander = st.expander("🥧 Strength Distribution", expanded=False,
+                               key="pie_expander", on_change="rerun")
+    if pie_expander.open:
+        with pie_expander:
+            fig = build_strength_pie(tuple(strength_counts[strength_counts > 0].items()))
+            st.plotly_chart(fig, width="stretch", config=_PLOTLY_CFG)
     
     # Recent analyses table
     st.markdown("### Recent Analyses")
@@ -595,59 +720,66 @@ def security_dashboard_page():
             file_name=f"password_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv"
         )
+    
+    # Also rotates the history id, so anyone holding the old one sees nothing
+    if st.button("🗑️ Clear History"):
+        clear_history()
+        st.rerun()
+
+SECURITY_TIPS = {
+    "🔑 Password Creation": [
+        "Use at least 12 characters (16+ is better)",
+        "Include uppercase, lowercase, numbers, and symbols",
+        "Avoid dictionary words and personal information",
+        "Don't use keyboard patterns (qwerty, 123456)",
+        "Create unique passwords for each account"
+    ],
+    "🛡️ Password Management": [
+        "Use a reputable password manager",
+        "Enable two-factor authentication (2FA) everywhere",
+        "Never share passwords via email or text",
+        "Change passwords immediately if breached",
+        "Review and update passwords regularly"
+    ],
+    "⚠️ Common Mistakes": [
+        "Using the same password everywhere",
+        "Including personal info (birthdays, names)",
+        "Writing passwords on sticky notes",
+        "Sharing passwords with others",
+        "Using simple variations (Password1, Password2)"
+    ],
+    "🎯 Advanced Tips": [
+        "Use passphrases for master passwords",
+        "Enable login alerts when available",
+        "Use hardware security keys for critical accounts",
+        "Regularly check haveibeenpwned.com",
+        "Keep software and browsers updated"
+    ]
+}
+
+# Rendered once at import and emitted as a single Markdown element
+_TIPS_MD = "\n\n".join(
+    f"### {category}\n" + "\n".join(f"- {tip}" for tip in items)
+    for category, items in SECURITY_TIPS.items()
+)
 
 def security_tips_page():
     st.header("📚 Security Best Practices")
     st.markdown("Learn how to improve your password security")
     
-    tips = {
-        "🔑 Password Creation": [
-            "Use at least 12 characters (16+ is better)",
-            "Include uppercase, lowercase, numbers, and symbols",
-            "Avoid dictionary words and personal information",
-            "Don't use keyboard patterns (qwerty, 123456)",
-            "Create unique passwords for each account"
-        ],
-        "🛡️ Password Management": [
-            "Use a reputable password manager",
-            "Enable two-factor authentication (2FA) everywhere",
-            "Never share passwords via email or text",
-            "Change passwords immediately if breached",
-            "Review and update passwords regularly"
-        ],
-        "⚠️ Common Mistakes": [
-            "Using the same password everywhere",
-            "Including personal info (birthdays, names)",
-            "Writing passwords on sticky notes",
-            "Sharing passwords with others",
-            "Using simple variations (Password1, Password2)"
-        ],
-        "🎯 Advanced Tips": [
-            "Use passphrases for master passwords",
-            "Enable login alerts when available",
-            "Use hardware security keys for critical accounts",
-            "Regularly check haveibeenpwned.com",
-            "Keep software and browsers updated"
-        ]
-    }
-    
-    for category, items in tips.items():
-        st.markdown(f"### {category}")
-        for tip in items:
-            st.write(f"• {tip}")
-        st.markdown("")
+    st.markdown(_TIPS_MD)
     
     # Interactive password tips
     st.markdown("---")
     st.markdown("### 🎮 Interactive Tips")
     
     if st.button("Generate a Strong Password Example"):
-        example = st.session_state.generator.generate_random(20)
+        example = get_generator().generate_random(20)
         st.success(f"Example strong password: `{example}`")
         st.info("This password has high entropy and uses all character types!")
     
     if st.button("Generate a Memorable Passphrase"):
-        passphrase = st.session_state.generator.generate_passphrase()
+        passphrase = get_generator().generate_passphrase()
         st.success(f"Example passphrase: `{passphrase}`")
         st.info("Passphrases are long but easier to remember!")
     
@@ -661,27 +793,98 @@ def security_tips_page():
     - [Security Checklist](https://securitycheckli.st) - Personal security checklist
     """)
 
+# Charts are display-only, so the modebar and its config are left out
+_PLOTLY_CFG = {'displayModeBar': False, 'responsive': True}
+_PLOTLY_MARGIN = dict(l=10, r=10, t=30, b=10)
+
+@st.cache_data(show_spinner=False, ttl=24*60*60, max_entries=128)
+def build_gauge(score):
+    """Build the security score gauge for a given score"""
+    go = _plotly_go()
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Security Score"},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': get_score_color(score)},
+            'steps': [
+                {'range': [0, 20], 'color': "lightgray"},
+                {'range': [20, 40], 'color': "lightyellow"},
+                {'range': [40, 60], 'color': "lightblue"},
+                {'range': [60, 80], 'color': "lightgreen"},
+                {'range': [80, 100], 'color': "darkgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 60
+            }
+        }
+    ))
+    fig.update_layout(height=300, margin=_PLOTLY_MARGIN, uirevision='static')
+    return fig
+
+@st.cache_data(show_spinner=False, ttl=24*60*60, max_entries=128)
+def build_score_trend(history_tuple):
+    """Build the score trend line from a hashable analysis history"""
+    go = _plotly_go()
+    history = [dict(entry) for entry in history_tuple]
+    # WebGL trace keeps rendering cheap as the history grows
+    fig = go.Figure(go.Scattergl(
+        x=[entry['timestamp'] for entry in history],
+        y=[entry['score'] for entry in history],
+        mode='lines+markers'
+    ))
+    fig.update_layout(title='Password Score Over Time', xaxis_title='timestamp',
+                      yaxis_title='score', yaxis_range=[0, 100],
+                      margin=_PLOTLY_MARGIN, uirevision='static')
+    return fig
+
+@st.cache_data(show_spinner=False, ttl=24*60*60, max_entries=128)
+def build_strength_pie(counts_tuple):
+    """Build the strength distribution pie from (strength, count) pairs"""
+    px = _plotly_px()
+    names = [strength for strength, _ in counts_tuple]
+    values = [count for _, count in counts_tuple]
+    fig = px.pie(values=values, names=names,
+                 title='Password Strength Distribution',
+                 color_discrete_map={
+                     'Very Strong': '#00CC00',
+                     'Strong': '#66FF66',
+                     'Moderate': '#FFFF00',
+                     'Weak': '#FF9900',
+                     'Very Weak': '#FF0000'
+                 })
+    fig.update_layout(margin=_PLOTLY_MARGIN, uirevision='static')
+    return fig
+
+# Pattern keys reported by PasswordAnalyzer.check_patterns
+KNOWN_PATTERNS = (
+    'sequential_numbers', 'sequential_letters', 'repeated_characters',
+    'keyboard_pattern', 'common_word', 'date_pattern'
+)
+_PATTERN_LABELS = {k: k.replace('_', ' ').title() for k in KNOWN_PATTERNS}
+
+STRENGTH_LEVELS = ("Very Weak", "Weak", "Moderate", "Strong", "Very Strong")
+
+_SCORE_BREAKS = (20, 40, 60, 80)
+_SCORE_COLORS = ("red", "darkorange", "orange", "green", "darkgreen")
+
+_STRENGTH_COLORS = {
+    "Very Strong": "darkgreen",
+    "Strong": "green",
+    "Moderate": "orange",
+    "Weak": "darkorange",
+    "Very Weak": "red"
+}
+
 def get_score_color(score):
-    if score >= 80:
-        return "darkgreen"
-    elif score >= 60:
-        return "green"
-    elif score >= 40:
-        return "orange"
-    elif score >= 20:
-        return "darkorange"
-    else:
-        return "red"
+    return _SCORE_COLORS[bisect.bisect_right(_SCORE_BREAKS, score)]
 
 def get_strength_color(strength):
-    colors = {
-        "Very Strong": "darkgreen",
-        "Strong": "green",
-        "Moderate": "orange",
-        "Weak": "darkorange",
-        "Very Weak": "red"
-    }
-    return colors.get(strength, "gray")
+    return _STRENGTH_COLORS.get(strength, "gray")
 
 if __name__ == "__main__":
     main()
@@ -3,34 +3,31 @@ Quick Demo Script for SecurePass Analyzer
 Tests core functionality without Streamlit interface
 """
 
-import sys
-import os
+from demo_common import get_checker, get_generator, run_basic_workflow
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from password_analyzer import PasswordAnalyzer
-from breach_checker import BreachChecker
-from password_generator import PasswordGenerator
+# (label, password kind, args, kwargs) for the password type examples
+GEN_SPECS = (
+    ("Memorable", "memorable", (4,), {}),
+    ("Pronounceable", "pronounceable", (12,), {}),
+    ("Passphrase", "passphrase", (5,), {}),
+    ("Custom Pattern", "custom_pattern", ("LLLLdddd!@",), {})
+)
 
 
 def main():
     print("🔐 SecurePass Analyzer - Quick Demo")
     print("="*50)
     
-    # Initialize components
-    analyzer = PasswordAnalyzer()
-    generator = PasswordGenerator()
-    checker = BreachChecker()
+    # Shared components
+    generator = get_generator()
+    checker = get_checker()
     
-    # 1. Generate a password
+    # 1. Generate a password and 2. analyze it
+    password, analysis = run_basic_workflow()
     print("\n1. 🎲 Generating a secure password...")
-    password = generator.generate_random(16, use_symbols=True)
     print(f"   Generated: {password}")
     
-    # 2. Analyze the password
     print("\n2. 🔍 Analyzing password strength...")
-    analysis = analyzer.analyze(password)
     print(f"   Score: {analysis['score']}/100")
     print(f"   Strength: {analysis['strength']}")
     print(f"   Entropy: {analysis['entropy_bits']} bits")
@@ -51,6 +48,9 @@ def main():
     except Exception as e:
         print(f"   ⚠️ Could not check breaches: {e}")
     
+    # The plaintext is not needed past this point, so drop our reference to it
+    del password
+    
     # 4. Show recommendations
     print("\n4. 💡 Recommendations:")
     for i, rec in enumerate(analysis['recommendations'][:3], 1):
@@ -59,20 +59,15 @@ def main():
     # 5. Generate different types of passwords
     print("\n5. 🎯 Different password types:")
     
-    examples = [
-        ("Memorable", lambda: generator.generate_memorable(4)),
-        ("Pronounceable", lambda: generator.generate_pronounceable(12)),
-        ("Passphrase", lambda: generator.generate_passphrase(5)),
-        ("Custom Pattern", lambda: generator.generate_custom_pattern("LLLLdddd!@"))
-    ]
-    
-    for name, func in examples:
-        try:
-            pwd = func()
-            strength = generator.estimate_strength(pwd)['strength']
-            print(f"   {name}: {pwd} ({strength})")
-        except Exception as e:
-            print(f"   {name}: Error - {e}")
+    # A failing spec reports its own error without dropping the other examples
+    passwords = generator.generate_spec_batch([spec[1:] for spec in GEN_SPECS],
+                                              return_exceptions=True)
+    for (name, *_), pwd in zip(GEN_SPECS, passwords):
+        if isinstance(pwd, Exception):
+            print(f"   {name}: Error - {pwd}")
+            continue
+        strength = generator.estimate_strength(pwd)['strength']
+        print(f"   {name}: {pwd} ({strength})")
     
     print("\n" + "="*50)
     print("Demo completed! 🎉")
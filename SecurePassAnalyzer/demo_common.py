@@ -0,0 +1,43 @@
+"""
+Shared helpers for the demo scripts
+Lazily builds one analyzer, generator and checker per interpreter so demo.py
+and docs/examples.py reuse the same instances
+"""
+
+import sys
+import os
+import functools
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from password_analyzer import PasswordAnalyzer
+from breach_checker import BreachChecker
+from password_generator import PasswordGenerator
+
+
+@functools.lru_cache(maxsize=1)
+def get_analyzer():
+    """Return the shared PasswordAnalyzer"""
+    return PasswordAnalyzer()
+
+
+@functools.lru_cache(maxsize=1)
+def get_generator():
+    """Return the shared PasswordGenerator"""
+    return PasswordGenerator()
+
+
+@functools.lru_cache(maxsize=1)
+def get_checker():
+    """Return the shared BreachChecker backed by a pooled HTTP session"""
+    return BreachChecker()
+
+
+def run_basic_workflow(length=16):
+    """
+    Generate a random password with symbols and analyze it
+    Returns (password, analysis); breach checking is left to the caller
+    """
+    password = get_generator().generate_random(length, use_symbols=True)
+    return password, get_analyzer().analyze(password)
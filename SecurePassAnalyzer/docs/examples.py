@@ -3,24 +3,83 @@ SecurePass Analyzer - Usage Examples
 Demonstrates how to use all the features programmatically
 """
 
+import contextlib
+import functools
+import io
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add the project root (for demo_common) to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from password_analyzer import PasswordAnalyzer
-from breach_checker import BreachChecker
-from password_generator import PasswordGenerator
+from demo_common import get_analyzer, get_checker, get_generator, run_basic_workflow
 
+def batched_print(func):
+    """Buffer everything func prints and write it to stdout in a single call"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return func(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+def _capture_output(func):
+    """Run func and return everything it printed, for use in worker processes"""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        func()
+    return buffer.getvalue()
+
+
+# Asterisk masks for passwords up to 128 characters, built once at import
+_MASK_CACHE = tuple('*' * i for i in range(129))
+
+
+def _mask(password):
+    """Return an asterisk mask the same length as password"""
+    length = len(password)
+    return _MASK_CACHE[length] if length < len(_MASK_CACHE) else '*' * length
+
+
+# Line formats bound once and reused inside the demo loops
+_SCORE_LINE = "Score: {}/100 ({})".format
+_ROW_FMT = "{:<35} {:<8} {:<12} {:.1f} bits".format
+
+
+# (character_diversity key, label) pairs listed by demo_password_analysis
+_DIVERSITY_LABELS = (
+    ('has_lowercase', 'lowercase'),
+    ('has_uppercase', 'uppercase'),
+    ('has_numbers', 'numbers'),
+    ('has_symbols', 'symbols')
+)
+
+
+# (label, password kind, args, kwargs) for demo_password_generation
+GENERATION_SPECS = (
+    ("Random 16-char", "random", (16,), {}),
+    ("Random 20-char high security", "random", (20,), {"use_symbols": True}),
+    ("Memorable", "memorable", (), {"word_count": 4}),
+    ("Pronounceable", "pronounceable", (14,), {}),
+    ("Passphrase", "passphrase", (), {"word_count": 5}),
+    ("Custom Pattern", "custom_pattern", ("LLLLdddd!@",), {})
+)
 
+
+@batched_print
 def demo_password_analysis():
     """Demonstrate password analysis features"""
     print("="*60)
     print("PASSWORD ANALYSIS DEMO")
     print("="*60)
     
-    analyzer = PasswordAnalyzer()
+    analyzer = get_analyzer()
     
     test_passwords = [
         ("password123", "Common weak password"),
@@ -30,23 +89,19 @@ def demo_password_analysis():
         ("qwerty", "Keyboard pattern")
     ]
     
-    for password, description in test_passwords:
+    analyses = analyzer.batch_analyze([password for password, _ in test_passwords])
+    
+    for (password, description), analysis in zip(test_passwords, analyses):
         print(f"\nAnalyzing: {description}")
-        print(f"Password: {'*' * len(password)}")  # Masked for security
+        print(f"Password: {_mask(password)}")  # Masked for security
         
-        analysis = analyzer.analyze(password)
-        
-        print(f"Score: {analysis['score']}/100 ({analysis['strength']})")
+        print(_SCORE_LINE(analysis['score'], analysis['strength']))
         print(f"Entropy: {analysis['entropy_bits']} bits")
         print(f"Length: {analysis['password_length']} characters")
         
         # Show character diversity
         diversity = analysis['character_diversity']
-        char_types = []
-        if diversity['has_lowercase']: char_types.append("lowercase")
-        if diversity['has_uppercase']: char_types.append("uppercase")
-        if diversity['has_numbers']: char_types.append("numbers")
-        if diversity['has_symbols']: char_types.append("symbols")
+        char_types = [name for key, name in _DIVERSITY_LABELS if diversity.get(key)]
         print(f"Character types: {', '.join(char_types)}")
         
         # Show patterns found
@@ -61,13 +116,14 @@ def demo_password_analysis():
         print("-" * 40)
 
 
+@batched_print
 def demo_breach_checking():
     """Demonstrate breach checking features"""
     print("\n" + "="*60)
     print("BREACH CHECKING DEMO")
     print("="*60)
     
-    checker = BreachChecker()
+    checker = get_checker()
     
     # Note: These are known breached passwords for demonstration
     test_passwords = [
@@ -77,12 +133,19 @@ def demo_breach_checking():
         ("ThisIsAVerySecurePassword123!", "Custom strong password")
     ]
     
-    for password, description in test_passwords:
+    # The lookups are independent, so issue them concurrently and print in order
+    with ThreadPoolExecutor(max_workers=len(test_passwords)) as executor:
+        futures = [
+            (password, description, executor.submit(checker.check_password_breach, password))
+            for password, description in test_passwords
+        ]
+    
+    for password, description, future in futures:
         print(f"\nChecking: {description}")
-        print(f"Password: {'*' * len(password)}")
+        print(f"Password: {_mask(password)}")
         
         try:
-            is_breached, count = checker.check_password_breach(password)
+            is_breached, count = future.result()
             
             if is_breached:
                 risk_level = checker._calculate_risk_level(is_breached, count)
@@ -100,39 +163,31 @@ def demo_breach_checking():
     print("   is never sent to any server, only a partial hash is transmitted.")
 
 
+@batched_print
 def demo_password_generation():
     """Demonstrate password generation features"""
     print("\n" + "="*60)
     print("PASSWORD GENERATION DEMO")
     print("="*60)
     
-    generator = PasswordGenerator()
-    analyzer = PasswordAnalyzer()
+    generator = get_generator()
+    analyzer = get_analyzer()
     
-    generation_methods = [
-        ("Random 16-char", lambda: generator.generate_random(16)),
-        ("Random 20-char high security", lambda: generator.generate_random(20, use_symbols=True)),
-        ("Memorable", lambda: generator.generate_memorable(word_count=4)),
-        ("Pronounceable", lambda: generator.generate_pronounceable(14)),
-        ("Passphrase", lambda: generator.generate_passphrase(word_count=5)),
-        ("Custom Pattern", lambda: generator.generate_custom_pattern("LLLLdddd!@"))
-    ]
-    
-    for method_name, generation_func in generation_methods:
+    # A failing spec reports its own error without dropping the other examples
+    passwords = generator.generate_spec_batch([spec[1:] for spec in GENERATION_SPECS],
+                                              return_exceptions=True)
+    for (method_name, *_), password in zip(GENERATION_SPECS, passwords):
         print(f"\n{method_name}:")
+        if isinstance(password, Exception):
+            print(f"❌ Error: {password}")
+            continue
+        print(f"Generated: {password}")
         
-        try:
-            password = generation_func()
-            print(f"Generated: {password}")
-            
-            # Quick analysis
-            quick_analysis = generator.estimate_strength(password)
-            print(f"Estimated strength: {quick_analysis['strength']}")
-            print(f"Entropy: {quick_analysis['entropy']:.1f} bits")
-            print(f"Character set size: {quick_analysis['charset_size']}")
-            
-        except Exception as e:
-            print(f"❌ Error: {e}")
+        # Quick analysis
+        quick_analysis = generator.estimate_strength(password)
+        print(f"Estimated strength: {quick_analysis['strength']}")
+        print(f"Entropy: {quick_analysis['entropy']:.1f} bits")
+        print(f"Character set size: {quick_analysis['charset_size']}")
         
         print("-" * 40)
     
@@ -144,24 +199,21 @@ def demo_password_generation():
         print(f"{i}. {pwd} ({strength})")
 
 
+@batched_print
 def demo_complete_workflow():
     """Demonstrate a complete security analysis workflow"""
     print("\n" + "="*60)
     print("COMPLETE SECURITY WORKFLOW DEMO")
     print("="*60)
     
-    # Initialize all components
-    analyzer = PasswordAnalyzer()
-    checker = BreachChecker()
-    generator = PasswordGenerator()
+    checker = get_checker()
+    password, analysis = run_basic_workflow()
     
     print("\n1. Generate a secure password:")
-    password = generator.generate_random(16, use_symbols=True)
     print(f"Generated: {password}")
     
     print("\n2. Analyze its strength:")
-    analysis = analyzer.analyze(password)
-    print(f"Score: {analysis['score']}/100 ({analysis['strength']})")
+    print(_SCORE_LINE(analysis['score'], analysis['strength']))
     print(f"Entropy: {analysis['entropy_bits']} bits")
     
     print("\n3. Check for breaches:")
@@ -174,6 +226,9 @@ def demo_complete_workflow():
     except Exception as e:
         print(f"Could not check breaches: {e}")
     
+    # The plaintext is not needed past this point, so drop our reference to it
+    del password
+    
     print("\n4. Recommendations:")
     for rec in analysis['recommendations'][:3]:
         print(f"• {rec}")
@@ -183,13 +238,14 @@ def demo_complete_workflow():
     print("="*60)
 
 
+@batched_print
 def show_password_strength_comparison():
     """Show comparison of different password strengths"""
     print("\n" + "="*60)
     print("PASSWORD STRENGTH COMPARISON")
     print("="*60)
     
-    analyzer = PasswordAnalyzer()
+    analyzer = get_analyzer()
     
     comparison_passwords = [
         ("123456", "Very weak - common pattern"),
@@ -203,9 +259,10 @@ def show_password_strength_comparison():
     print(f"{'Password Type':<35} {'Score':<8} {'Strength':<12} {'Entropy'}")
     print("-" * 75)
     
-    for pwd, description in comparison_passwords:
-        analysis = analyzer.analyze(pwd)
-        print(f"{description:<35} {analysis['score']:<8} {analysis['strength']:<12} {analysis['entropy_bits']:.1f} bits")
+    analyses = analyzer.batch_analyze([pwd for pwd, _ in comparison_passwords])
+    
+    for (pwd, description), analysis in zip(comparison_passwords, analyses):
+        print(_ROW_FMT(description, analysis['score'], analysis['strength'], analysis['entropy_bits']))
     
     print("\n💡 Key Takeaways:")
     print("• Length matters significantly for security")
@@ -218,12 +275,21 @@ if __name__ == "__main__":
     print("SecurePass Analyzer - Usage Examples")
     print("This script demonstrates all the major features")
     
+    demos = (
+        demo_password_analysis,
+        demo_password_generation,
+        demo_breach_checking,
+        show_password_strength_comparison,
+        demo_complete_workflow
+    )
+    
     try:
-        demo_password_analysis()
-        demo_password_generation()
-        demo_breach_checking()
-        show_password_strength_comparison()
-        demo_complete_workflow()
+        # The demos are independent: run them in parallel and print in order
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_capture_output, demo) for demo in demos]
+            for future in futures:
+                sys.stdout.write(future.result())
+        sys.stdout.flush()
         
         print("\n🎉 All demos completed successfully!")
         print("\nTo run the full interactive application:")
@@ -7,6 +7,8 @@ import os
 import subprocess
 import sys
 
+from launch import snapshot_paths
+
 
 def check_git_status():
     """Check if git is initialized and files are committed"""
@@ -44,8 +46,11 @@ def initialize_git():
         return False
 
 
-def check_required_files():
+def check_required_files(existing=None):
     """Check if all deployment files are present"""
+    if existing is None:
+        existing = snapshot_paths()
+    
     required_files = {
         'LICENSE': 'MIT License file',
         'Procfile': 'Heroku deployment configuration',
@@ -57,7 +62,7 @@ def check_required_files():
     
     missing_files = []
     for file_path, description in required_files.items():
-        if not os.path.exists(file_path):
+        if os.path.normpath(file_path) not in existing:
             missing_files.append((file_path, description))
     
     return missing_files
@@ -155,8 +160,10 @@ def main():
     print("🚀 SecurePass Analyzer - Deployment Preparation")
     print("="*60)
     
+    existing = snapshot_paths()
+    
     # Check current directory
-    if not os.path.exists('app.py'):
+    if 'app.py' not in existing:
         print("❌ Error: Run this from the SecurePassAnalyzer directory")
         return
     
@@ -164,7 +171,7 @@ def main():
     
     # Check required files
     print("\n📁 Checking deployment files...")
-    missing_files = check_required_files()
+    missing_files = check_required_files(existing)
     
     if missing_files:
         print("❌ Missing deployment files:")
@@ -205,12 +212,12 @@ def main():
     print("="*60)
     
     checklist = [
-        ("📄 LICENSE file", os.path.exists('LICENSE')),
-        ("⚙️ Deployment configs", len(check_required_files()) == 0),
+        ("📄 LICENSE file", 'LICENSE' in existing),
+        ("⚙️ Deployment configs", not missing_files),
         ("📝 Git repository", git_ready),
-        ("🐍 Dependencies", os.path.exists('requirements.txt')),
-        ("📚 Documentation", os.path.exists('docs/README.md')),
-        ("🧪 Tests passing", os.path.exists('tests/run_tests.py'))
+        ("🐍 Dependencies", 'requirements.txt' in existing),
+        ("📚 Documentation", os.path.normpath('docs/README.md') in existing),
+        ("🧪 Tests passing", os.path.normpath('tests/run_tests.py') in existing)
     ]
     
     for item, status in checklist:
@@ -5,55 +5,235 @@ Uses k-anonymity to securely check passwords without sending them in plaintext
 """
 
 import hashlib
+import math
+import mmap
+import struct
+import threading
 import requests
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple, Union
 import time
 
+# orjson parses large breach listings several times faster; stdlib json is the fallback
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Number of HIBP range responses (one per 5-char hash prefix) memoized per checker;
+# each parsed range holds several hundred suffixes, so keep this modest
+RANGE_CACHE_SIZE = 128
+
+# Seconds a cached range stays fresh; the app shares one checker for the life of the
+# server, so counts are refetched periodically rather than cached forever
+RANGE_CACHE_TTL = 60 * 60
+
+# Longest wait, in seconds, between 429 retries; caps both Retry-After and the backoff
+MAX_RETRY_WAIT = 30.0
+
+# Risk levels returned by _calculate_risk_level, lowest to highest
+RISK_LEVELS = ('Safe', 'Low Risk', 'Medium Risk', 'High Risk', 'Critical Risk')
+
+# Bullet masks for passwords up to 64 characters, built once at import
+_MASK_CACHE = tuple('•' * i for i in range(65))
+
+
+def _mask(password: str) -> str:
+    """Return a bullet mask the same length as password"""
+    length = len(password)
+    return _MASK_CACHE[length] if length < len(_MASK_CACHE) else '•' * length
+
+
+class APIStatusError(Exception):
+    """Raised when the HIBP API answers with an unexpected HTTP status"""
+    
+    def __init__(self, status_code: int):
+        super().__init__(f"API Error: Status {status_code}")
+        self.status_code = status_code
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 8,
+                   retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
+    """
+    Create a requests.Session with a keep-alive connection pool for HIBP calls
+    Reusing one session avoids a new TCP/TLS handshake on every lookup; 5xx responses
+    are retried with exponential backoff, while 429s are left to _get_with_retry so
+    rate-limited lookups are not retried at two layers
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window rate limiter
+    Allows at most max_rate acquisitions in any time_period seconds, blocking callers beyond that
+    """
+    
+    def __init__(self, max_rate: int = 40, time_period: float = 60.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._calls = deque()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until another call fits in the window, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.time_period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_rate:
+                    self._calls.append(now)
+                    return
+                wait = self.time_period - (now - self._calls[0])
+            time.sleep(wait)
+
+
+class HashBloomFilter:
+    """
+    Bloom filter over SHA-1 hex digests, used as an offline pre-check before HIBP
+    SHA-1 output is already uniform, so bit positions are derived straight from the digest
+    """
+    
+    # File header: filter size in bits, number of bit positions per hash
+    _HEADER = struct.Struct('<QI')
+    
+    def __init__(self, size_bits: int, num_hashes: int, bits=None):
+        self.size_bits = size_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((size_bits + 7) // 8)
+    
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.01) -> 'HashBloomFilter':
+        """Create an empty filter sized for capacity hashes at the given false-positive rate"""
+        size_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(size_bits / max(capacity, 1) * math.log(2)))
+        return cls(size_bits, num_hashes)
+    
+    def _positions(self, sha1_hex: str):
+        """Bit positions for a digest via double hashing over two 64-bit slices of it"""
+        digest = int(sha1_hex, 16)
+        h1 = digest >> 96
+        h2 = ((digest >> 32) & 0xFFFFFFFFFFFFFFFF) | 1
+        return ((h1 + i * h2) % self.size_bits for i in range(self.num_hashes))
+    
+    def add(self, sha1_hex: str):
+        """Add a SHA-1 hex digest to the filter"""
+        for position in self._positions(sha1_hex):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, sha1_hex: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(sha1_hex))
+    
+    def save(self, path: str):
+        """Write the filter to path"""
+        with open(path, 'wb') as f:
+            f.write(self._HEADER.pack(self.size_bits, self.num_hashes))
+            f.write(self.bits)
+    
+    @classmethod
+    def load(cls, path: str) -> 'HashBloomFilter':
+        """Memory-map a filter written by save(), so only touched pages are read"""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        size_bits, num_hashes = cls._HEADER.unpack_from(mapped)
+        return cls(size_bits, num_hashes, memoryview(mapped)[cls._HEADER.size:])
+    
+    @classmethod
+    def from_hash_file(cls, path: str, error_rate: float = 0.01) -> 'HashBloomFilter':
+        """
+        Build a filter from a downloaded Pwned Passwords SHA-1 file ("HASH:count" per line)
+        The file is read twice: once to size the filter, once to fill it
+        """
+        with open(path, encoding='ascii') as f:
+            capacity = sum(1 for line in f if line.strip())
+        
+        bloom = cls.for_capacity(capacity, error_rate)
+        with open(path, encoding='ascii') as f:
+            for line in f:
+                sha1_hex = line.split(':', 1)[0].strip()
+                if sha1_hex:
+                    bloom.add(sha1_hex)
+        return bloom
+
+
 class BreachChecker:
     """Check passwords and emails against known data breaches"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 offline_index: Optional[Union[str, HashBloomFilter]] = None):
+        # Passwords missing from the offline index are reported safe without a network call
+        if isinstance(offline_index, str):
+            offline_index = HashBloomFilter.load(offline_index)
+        self.offline_index = offline_index
+        # Only sessions created here are closed by close()
+        self._owns_session = session is None
+        self.session = session if session is not None else create_session()
+        self.rate_limiter = rate_limiter or RateLimiter()
         self.hibp_password_api = "https://api.pwnedpasswords.com/range/"
         self.hibp_breach_api = "https://haveibeenpwned.com/api/v3/breachedaccount/"
         self.hibp_paste_api = "https://haveibeenpwned.com/api/v3/pasteaccount/"
         self.headers = {
             'User-Agent': 'SecurePass-Analyzer-1.0'
         }
+        # prefix -> (fetch time, range table), least recently used first
+        self._range_cache: 'OrderedDict[str, Tuple[float, Dict[bytes, bytes]]]' = OrderedDict()
+        self._range_lock = threading.Lock()
         
+    def close(self):
+        """Release the pooled connections of the checker's own session"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def check_password_breach(self, password: str) -> Tuple[bool, int]:
         """
         Check if password has been found in data breaches using k-anonymity
         Returns: (is_breached, number_of_times_seen)
         """
         try:
-            # Create SHA-1 hash of the password
+            # Create SHA-1 hash of the password; hexdigest().upper() measured faster than
+            # the digest()-based hex/b16encode variants, so the str form is kept
             sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
             
+            # A negative from the offline Bloom filter is definitive; positives need the count
+            if self.offline_index is not None and sha1_hash not in self.offline_index:
+                return False, 0
+            
             # Take first 5 characters for k-anonymity
             prefix = sha1_hash[:5]
             suffix = sha1_hash[5:]
             
-            # Query the API
-            response = requests.get(
-                f"{self.hibp_password_api}{prefix}",
-                headers=self.headers,
-                timeout=10
-            )
-            
-            if response.status_code != 200:
-                print(f"API Error: Status {response.status_code}")
-                return False, 0
-            
-            # Check if our hash suffix appears in the results
-            hashes = response.text.split('\r\n')
-            for hash_entry in hashes:
-                if ':' in hash_entry:
-                    hash_suffix, count = hash_entry.split(':')
-                    if hash_suffix == suffix:
-                        return True, int(count)
+            # Responses are cached by prefix, so repeated prefixes skip the network
+            count = int(self._cached_range(prefix).get(suffix.encode('ascii'), 0))
+            return count > 0, count
             
+        except APIStatusError as e:
+            print(e)
             return False, 0
-            
         except requests.exceptions.RequestException as e:
             print(f"Network error checking password breach: {e}")
             return False, 0
@@ -61,6 +241,49 @@ class BreachChecker:
             print(f"Error checking password breach: {e}")
             return False, 0
     
+    def _fetch_range(self, prefix: str) -> Dict[bytes, bytes]:
+        """
+        Fetch the HIBP range for a hash prefix as a {suffix: count} table of raw bytes
+        Raises APIStatusError on a non-200 response so failures are never cached
+        """
+        # Only real network lookups take a rate-limit token; offline-index negatives
+        # and cached prefixes return before reaching this point
+        self.rate_limiter.acquire()
+        response = self._get_with_retry(f"{self.hibp_password_api}{prefix}", self.headers)
+        
+        if response.status_code != 200:
+            raise APIStatusError(response.status_code)
+        
+        # "SUFFIX:count" lines become alternating suffix/count tokens, paired up without
+        # decoding the body; counts stay as bytes and only the one looked up is converted
+        tokens = response.content.replace(b':', b' ').split()
+        return dict(zip(tokens[::2], tokens[1::2]))
+    
+    def _cached_range(self, prefix: str) -> Dict[bytes, bytes]:
+        """
+        Return the range for a hash prefix, fetching it when missing or older than RANGE_CACHE_TTL
+        At most RANGE_CACHE_SIZE ranges are kept, evicting the least recently used
+        """
+        with self._range_lock:
+            entry = self._range_cache.get(prefix)
+            if entry is not None and time.monotonic() - entry[0] < RANGE_CACHE_TTL:
+                self._range_cache.move_to_end(prefix)
+                return entry[1]
+        
+        # Fetch outside the lock so lookups of other prefixes are not serialized
+        table = self._fetch_range(prefix)
+        with self._range_lock:
+            self._range_cache[prefix] = (time.monotonic(), table)
+            self._range_cache.move_to_end(prefix)
+            while len(self._range_cache) > RANGE_CACHE_SIZE:
+                self._range_cache.popitem(last=False)
+        return table
+    
+    def clear_cache(self):
+        """Drop all memoized HIBP range responses"""
+        with self._range_lock:
+            self._range_cache.clear()
+    
     def check_email_breaches(self, email: str, api_key: Optional[str] = None) -> Dict:
         """
         Check if email has been found in data breaches
@@ -82,17 +305,13 @@ class BreachChecker:
             headers = self.headers.copy()
             headers['hibp-api-key'] = api_key
             
-            response = requests.get(
-                f"{self.hibp_breach_api}{email}",
-                headers=headers,
-                timeout=10
-            )
+            response = self._get_with_retry(f"{self.hibp_breach_api}{email}", headers)
             
             if response.status_code == 404:
                 # No breaches found
                 return result
             elif response.status_code == 200:
-                breaches = response.json()
+                breaches = json_loads(response.content)
                 result['breached'] = True
                 result['breach_count'] = len(breaches)
                 
@@ -117,24 +336,52 @@ class BreachChecker:
         
         return result
     
-    def batch_check_passwords(self, passwords: List[str]) -> List[Dict]:
+    def _get_with_retry(self, url: str, headers: Dict, max_attempts: int = 5) -> requests.Response:
+        """
+        GET a HIBP endpoint, retrying when the API responds 429 (rate limited)
+        Waits for a valid Retry-After header, otherwise backs off exponentially;
+        every wait is clamped to 0..MAX_RETRY_WAIT seconds
+        """
+        delay = 1.5
+        for attempt in range(max_attempts):
+            response = self.session.get(url, headers=headers, timeout=10)
+            if response.status_code != 429 or attempt == max_attempts - 1:
+                return response
+            
+            try:
+                wait = float(response.headers['Retry-After'])
+            except (KeyError, TypeError, ValueError):
+                wait = delay
+            if math.isnan(wait):
+                wait = delay
+            time.sleep(min(max(wait, 0.0), MAX_RETRY_WAIT))
+            delay = min(delay * 2, MAX_RETRY_WAIT)
+        
+        return response
+    
+    def batch_check_passwords(self, passwords: List[str], max_workers: int = 8,
+                              include_mask: bool = True) -> List[Dict]:
         """
         Check multiple passwords for breaches
-        Includes rate limiting to respect API limits
+        Lookups run concurrently on up to max_workers threads; range requests are paced by the rate limiter
+        Set include_mask=False to leave the masked 'password' field out of each result
         """
-        results = []
+        if not passwords:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(passwords))) as executor:
+            outcomes = list(executor.map(self.check_password_breach, passwords))
         
-        for password in passwords:
-            is_breached, count = self.check_password_breach(password)
-            results.append({
-                'password': '•' * len(password),  # Masked for security
+        results = []
+        for password, (is_breached, count) in zip(passwords, outcomes):
+            result = {
                 'is_breached': is_breached,
                 'exposure_count': count,
                 'risk_level': self._calculate_risk_level(is_breached, count)
-            })
-            
-            # Rate limiting: 1 request per 1.5 seconds
-            time.sleep(1.5)
+            }
+            if include_mask:
+                result['password'] = _mask(password)  # Masked for security
+            results.append(result)
         
         return results
     
@@ -151,29 +398,20 @@ class BreachChecker:
         else:
             return "Critical Risk"
     
-    def get_breach_statistics(self, passwords: List[str]) -> Dict:
-        """Generate statistics for a set of passwords"""
-        total = len(passwords)
-        breached_count = 0
-        total_exposures = 0
-        risk_distribution = {
-            'Safe': 0,
-            'Low Risk': 0,
-            'Medium Risk': 0,
-            'High Risk': 0,
-            'Critical Risk': 0
-        }
+    def get_breach_statistics(self, results: Union[List[Dict], List[str]]) -> Dict:
+        """
+        Generate statistics for a set of passwords
+        Accepts the output of batch_check_passwords, or raw passwords which are checked in one batch
+        """
+        if results and isinstance(results[0], str):
+            results = self.batch_check_passwords(results, include_mask=False)
         
-        for password in passwords:
-            is_breached, count = self.check_password_breach(password)
-            if is_breached:
-                breached_count += 1
-                total_exposures += count
-            
-            risk_level = self._calculate_risk_level(is_breached, count)
-            risk_distribution[risk_level] += 1
-            
-            time.sleep(1.5)  # Rate limiting
+        total = len(results)
+        breached_count = sum(r['is_breached'] for r in results)
+        total_exposures = sum(r['exposure_count'] for r in results if r['is_breached'])
+        
+        risk_distribution = dict.fromkeys(RISK_LEVELS, 0)
+        risk_distribution.update(Counter(r['risk_level'] for r in results))
         
         return {
             'total_checked': total,
@@ -3,11 +3,117 @@ Password Strength Analyzer Module
 Analyzes password strength using multiple metrics including entropy, patterns, and common weaknesses
 """
 
+import os
 import re
 import math
-from typing import Dict, List, Tuple
+import functools
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
 import zxcvbn
 
+# numpy (installed with pandas) vectorizes calculate_entropy_bulk; it is optional here
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Weakness patterns checked by check_patterns, compiled once at import
+PATTERNS = {
+    'sequential_numbers': re.compile(r'(012|123|234|345|456|567|678|789|890)'),
+    'sequential_letters': re.compile(r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)'),
+    'repeated_characters': re.compile(r'(.)\1{2,}'),
+    'date_pattern': re.compile(r'\d{2,4}[-/]\d{2}[-/]\d{2,4}|\d{6,8}')
+}
+
+# Character classes used for entropy and diversity checks
+CHAR_CLASSES = {
+    'lowercase': re.compile(r'[a-z]'),
+    'uppercase': re.compile(r'[A-Z]'),
+    'numbers': re.compile(r'[0-9]'),
+    'symbols': re.compile(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]')
+}
+
+# Bit flag per character class, plus one for spaces (has_spaces)
+CLASS_BITS = {'lowercase': 1, 'uppercase': 2, 'numbers': 4, 'symbols': 8}
+SPACE_BIT = 16
+
+# Byte -> class flags, derived from CHAR_CLASSES so both always agree.
+# Non-ASCII bytes map to 0, matching the ASCII-only classes above
+_CLASS_TABLE = bytes(
+    sum(bit for name, bit in CLASS_BITS.items() if CHAR_CLASSES[name].match(chr(i)))
+    | (SPACE_BIT if chr(i) == ' ' else 0)
+    for i in range(256)
+)
+
+# Charset size contributed by each class for entropy, and the total for every class mask
+_CHARSET_SIZES = {'lowercase': 26, 'uppercase': 26, 'numbers': 10, 'symbols': 32}
+_MASK_CHARSET_SIZE = tuple(
+    sum(size for name, size in _CHARSET_SIZES.items() if mask & CLASS_BITS[name])
+    for mask in range(SPACE_BIT * 2)
+)
+
+if np is not None:
+    _CLASS_TABLE_NP = np.frombuffer(_CLASS_TABLE, dtype=np.uint8)
+    # log2 of each mask's charset size via math.log2, so results match calculate_entropy exactly
+    _MASK_LOG2_NP = np.array([math.log2(size) if size else 0.0 for size in _MASK_CHARSET_SIZE])
+
+
+def class_mask(password: str) -> int:
+    """Return the OR of the class flags of every character in password"""
+    mask = 0
+    for flags in set(password.encode('utf-8', 'ignore').translate(_CLASS_TABLE)):
+        mask |= flags
+    return mask
+
+# One common password per line; replace with a larger list for real audits
+COMMON_PASSWORDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'common_passwords.txt')
+
+
+@functools.lru_cache(maxsize=None)
+def load_common_passwords(path: str = COMMON_PASSWORDS_FILE) -> frozenset:
+    """Read a common-password list once per path and share it between analyzers"""
+    with open(path, encoding='utf-8') as f:
+        return frozenset(
+            line.strip() for line in f
+            if line.strip() and not line.startswith('#')
+        )
+
+
+# zxcvbn refuses longer input, and its matching cost grows quickly with length
+ZXCVBN_MAX_LENGTH = 72
+
+
+def run_zxcvbn(password: str) -> Dict:
+    """
+    Run zxcvbn on at most the first ZXCVBN_MAX_LENGTH characters of password
+    Longer passwords are scored on their prefix instead of raising ValueError
+    """
+    return zxcvbn.zxcvbn(password[:ZXCVBN_MAX_LENGTH])
+
+
+# Scoring tiers for calculate_score: reaching TIERS[i] earns POINTS[i]; below the
+# first tier, points scale with the value instead
+LENGTH_TIERS = (8, 12, 16)
+LENGTH_POINTS = (15, 25, 30)
+ENTROPY_TIERS = (25, 40, 60)
+ENTROPY_POINTS = (10, 20, 30)
+
+# Score deducted for each pattern found by check_patterns
+PATTERN_PENALTIES = {
+    'sequential_numbers': -5,
+    'sequential_letters': -5,
+    'repeated_characters': -10,
+    'keyboard_pattern': -10,
+    'common_word': -20,
+    'date_pattern': -5
+}
+
+# Strength level for a score: STRENGTH_LEVELS[i] starts at STRENGTH_TIERS[i - 1]
+STRENGTH_TIERS = (20, 40, 60, 80)
+STRENGTH_LEVELS = ("Very Weak", "Weak", "Moderate", "Strong", "Very Strong")
+
+
 class PasswordAnalyzer:
     """Advanced password strength analyzer with multiple security metrics"""
     
@@ -17,28 +123,16 @@ class PasswordAnalyzer:
             'qwerty', 'asdf', 'zxcv', '1234', '0987',
             'qwertyuiop', 'asdfghjkl', 'zxcvbnm'
         ]
+        # All keyboard patterns in one alternation, scanned in a single regex pass
+        self._keyboard_regex = re.compile('|'.join(map(re.escape, self.keyboard_patterns)))
         
-    def _load_common_passwords(self) -> set:
-        """Load a set of common passwords to check against"""
-        # In production, this would load from a file
-        return {
-            'password', '123456', 'password123', 'admin', 'letmein',
-            'welcome', 'monkey', '1234567890', 'qwerty', 'abc123',
-            'Password1', 'password1', '123456789', 'welcome123'
-        }
+    def _load_common_passwords(self) -> frozenset:
+        """Load the shared set of common passwords to check against"""
+        return load_common_passwords()
     
     def calculate_entropy(self, password: str) -> float:
         """Calculate password entropy in bits"""
-        charset_size = 0
-        
-        if re.search(r'[a-z]', password):
-            charset_size += 26
-        if re.search(r'[A-Z]', password):
-            charset_size += 26
-        if re.search(r'[0-9]', password):
-            charset_size += 10
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]', password):
-            charset_size += 32
+        charset_size = _MASK_CHARSET_SIZE[class_mask(password)]
             
         if charset_size == 0:
             return 0
@@ -46,30 +140,56 @@ class PasswordAnalyzer:
         entropy = len(password) * math.log2(charset_size)
         return round(entropy, 2)
     
+    def calculate_entropy_bulk(self, passwords: Sequence[str]) -> List[float]:
+        """
+        Calculate entropy for many passwords at once, same values as calculate_entropy
+        With numpy, all passwords are classified in one vectorized pass over their bytes
+        """
+        if np is None or not passwords:
+            return [self.calculate_entropy(password) for password in passwords]
+        
+        encoded = [password.encode('utf-8', 'ignore') for password in passwords]
+        byte_lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        starts = np.concatenate(([0], np.cumsum(byte_lengths)[:-1]))
+        
+        # A trailing zero byte keeps reduceat in bounds when the last password is empty
+        flags = _CLASS_TABLE_NP[np.frombuffer(b''.join(encoded) + b'\0', dtype=np.uint8)]
+        masks = np.bitwise_or.reduceat(flags, starts)
+        masks[byte_lengths == 0] = 0
+        
+        lengths = np.fromiter(map(len, passwords), dtype=np.float64, count=len(passwords))
+        # np.round agrees with round() on every length * log2(charset) product (checked up to length 20000)
+        return np.round(lengths * _MASK_LOG2_NP[masks], 2).tolist()
+    
     def check_patterns(self, password: str) -> Dict[str, bool]:
         """Check for common patterns in password"""
+        lowered = password.lower()
         patterns = {
-            'sequential_numbers': bool(re.search(r'(012|123|234|345|456|567|678|789|890)', password.lower())),
-            'sequential_letters': bool(re.search(r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)', password.lower())),
-            'repeated_characters': bool(re.search(r'(.)\1{2,}', password)),
-            'keyboard_pattern': any(pattern in password.lower() for pattern in self.keyboard_patterns),
-            'common_word': password.lower() in self.common_passwords,
-            'date_pattern': bool(re.search(r'\d{2,4}[-/]\d{2}[-/]\d{2,4}|\d{6,8}', password))
+            'sequential_numbers': bool(PATTERNS['sequential_numbers'].search(lowered)),
+            'sequential_letters': bool(PATTERNS['sequential_letters'].search(lowered)),
+            'repeated_characters': bool(PATTERNS['repeated_characters'].search(password)),
+            'keyboard_pattern': bool(self._keyboard_regex.search(lowered)),
+            'common_word': lowered in self.common_passwords,
+            'date_pattern': bool(PATTERNS['date_pattern'].search(password))
         }
         return patterns
     
     def get_character_diversity(self, password: str) -> Dict[str, bool]:
         """Analyze character type diversity"""
+        mask = class_mask(password)
         return {
-            'has_lowercase': bool(re.search(r'[a-z]', password)),
-            'has_uppercase': bool(re.search(r'[A-Z]', password)),
-            'has_numbers': bool(re.search(r'[0-9]', password)),
-            'has_symbols': bool(re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]', password)),
-            'has_spaces': ' ' in password
+            'has_lowercase': bool(mask & CLASS_BITS['lowercase']),
+            'has_uppercase': bool(mask & CLASS_BITS['uppercase']),
+            'has_numbers': bool(mask & CLASS_BITS['numbers']),
+            'has_symbols': bool(mask & CLASS_BITS['symbols']),
+            'has_spaces': bool(mask & SPACE_BIT)
         }
     
-    def calculate_score(self, password: str) -> Tuple[int, str]:
-        """Calculate overall password score (0-100) and strength level"""
+    def calculate_score(self, password: str, zxcvbn_result: Optional[Dict] = None) -> Tuple[int, str]:
+        """
+        Calculate overall password score (0-100) and strength level
+        Pass zxcvbn_result if zxcvbn has already been run on password to avoid running it again
+        """
         if not password:
             return 0, "Empty"
             
@@ -77,76 +197,49 @@ class PasswordAnalyzer:
         
         # Length scoring (max 30 points)
         length = len(password)
-        if length >= 16:
-            score += 30
-        elif length >= 12:
-            score += 25
-        elif length >= 8:
-            score += 15
-        else:
-            score += max(0, length * 2)
+        tier = bisect_right(LENGTH_TIERS, length)
+        score += LENGTH_POINTS[tier - 1] if tier else max(0, length * 2)
         
         # Entropy scoring (max 30 points)
         entropy = self.calculate_entropy(password)
-        if entropy >= 60:
-            score += 30
-        elif entropy >= 40:
-            score += 20
-        elif entropy >= 25:
-            score += 10
-        else:
-            score += max(0, int(entropy / 2))
+        tier = bisect_right(ENTROPY_TIERS, entropy)
+        score += ENTROPY_POINTS[tier - 1] if tier else max(0, int(entropy / 2))
         
         # Character diversity (max 20 points)
         diversity = self.get_character_diversity(password)
-        score += sum([5 for value in diversity.values() if value])
+        score += 5 * sum(diversity.values())
         
         # Pattern penalties (max -30 points)
         patterns = self.check_patterns(password)
-        penalties = {
-            'sequential_numbers': -5,
-            'sequential_letters': -5,
-            'repeated_characters': -10,
-            'keyboard_pattern': -10,
-            'common_word': -20,
-            'date_pattern': -5
-        }
-        
-        for pattern, has_pattern in patterns.items():
-            if has_pattern:
-                score += penalties.get(pattern, 0)
+        score += sum(PATTERN_PENALTIES.get(pattern, 0)
+                     for pattern, has_pattern in patterns.items() if has_pattern)
         
         # Use zxcvbn for additional analysis (max 20 points)
-        zxcvbn_result = zxcvbn.zxcvbn(password)
+        if zxcvbn_result is None:
+            zxcvbn_result = run_zxcvbn(password)
         score += zxcvbn_result['score'] * 4
         
         # Ensure score is between 0 and 100
         score = max(0, min(100, score))
         
         # Determine strength level
-        if score >= 80:
-            strength = "Very Strong"
-        elif score >= 60:
-            strength = "Strong"
-        elif score >= 40:
-            strength = "Moderate"
-        elif score >= 20:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
+        strength = STRENGTH_LEVELS[bisect_right(STRENGTH_TIERS, score)]
             
         return score, strength
     
     def analyze(self, password: str) -> Dict:
-        """Perform complete password analysis"""
-        score, strength = self.calculate_score(password)
+        """
+        Perform complete password analysis
+        Nothing is memoized here, so the analyzer never retains plaintext passwords
+        """
+        # Get zxcvbn analysis once and share it with the scoring
+        zxcvbn_result = run_zxcvbn(password)
+        
+        score, strength = self.calculate_score(password, zxcvbn_result)
         patterns = self.check_patterns(password)
         diversity = self.get_character_diversity(password)
         entropy = self.calculate_entropy(password)
         
-        # Get zxcvbn analysis
-        zxcvbn_result = zxcvbn.zxcvbn(password)
-        
         # Time to crack estimates
         crack_times = {
             'offline_slow': zxcvbn_result['crack_times_display']['offline_slow_hashing_1e4_per_second'],
@@ -172,6 +265,23 @@ class PasswordAnalyzer:
             'suggestions': zxcvbn_result.get('feedback', {}).get('suggestions', [])
         }
     
+    def batch_analyze(self, passwords: Iterable[str], executor: Optional[Executor] = None) -> List[Dict]:
+        """
+        Analyze several passwords in one call, preserving input order
+        If an executor is given, the analyses are distributed over it with executor.map
+        """
+        mapper = executor.map if executor is not None else map
+        return list(mapper(self.analyze, passwords))
+    
+    def analyze_bulk_parallel(self, passwords: Iterable[str], max_workers: Optional[int] = None,
+                              chunksize: int = 64) -> List[Dict]:
+        """
+        Analyze many passwords across CPU cores, preserving input order
+        zxcvbn is pure Python and holds the GIL, so large audits scale with processes, not threads
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.analyze, passwords, chunksize=chunksize))
+    
     def generate_recommendations(self, password: str, patterns: Dict, diversity: Dict) -> List[str]:
         """Generate specific recommendations for password improvement"""
         recommendations = []
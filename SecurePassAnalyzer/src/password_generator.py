@@ -4,11 +4,80 @@ Generates strong, customizable passwords with various complexity rules
 Includes memorable password options and pronounceable passwords
 """
 
-import random
 import string
 import secrets
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from collections import Counter
 import json
+import functools
+from itertools import product
+from math import log2
+
+def secure_indices(size: int, count: int) -> List[int]:
+    """Draw count uniform indices below size from bulk token_bytes reads"""
+    if size <= 256:
+        # Reject bytes at or above the largest multiple of size to avoid modulo bias
+        limit = 256 - 256 % size
+        indices: List[int] = []
+        while len(indices) < count:
+            needed = count - len(indices)
+            indices.extend(b % size for b in secrets.token_bytes(needed + needed // 4 + 8)
+                           if b < limit)
+        del indices[count:]
+        return indices
+    
+    # Larger ranges read fixed-width big-endian chunks with the same rejection rule
+    width = (size.bit_length() + 7) // 8
+    span = 1 << (8 * width)
+    limit = span - span % size
+    indices = []
+    while len(indices) < count:
+        needed = count - len(indices)
+        raw = secrets.token_bytes((needed + needed // 4 + 8) * width)
+        for offset in range(0, len(raw), width):
+            value = int.from_bytes(raw[offset:offset + width], 'big')
+            if value < limit:
+                indices.append(value % size)
+    del indices[count:]
+    return indices
+
+
+def _byte_stream(chunk: int) -> Iterator[int]:
+    """Yield CSPRNG bytes indefinitely, reading chunk bytes at a time"""
+    while True:
+        yield from secrets.token_bytes(chunk)
+
+
+def secure_shuffle(items: list) -> None:
+    """Shuffle items in place with Fisher-Yates driven by bulk token_bytes reads"""
+    stream = _byte_stream(len(items) + 8)
+    for i in range(len(items) - 1, 0, -1):
+        bound = i + 1
+        if bound > 256:
+            j = secrets.randbelow(bound)
+        else:
+            # Rejection sampling keeps each swap index unbiased
+            limit = 256 - 256 % bound
+            j = next(b for b in stream if b < limit) % bound
+        items[i], items[j] = items[j], items[i]
+
+
+# Deletion table for characters that are easily confused (l/1/I, o/O/0)
+AMBIGUOUS_TABLE = str.maketrans('', '', 'loOI01')
+
+# Pattern characters that draw from a pool; anything else is a literal
+PATTERN_CHARS = frozenset('lLdsa*')
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Tuple[int, ...]], ...]]:
+    """Split a pattern into its literal template and the positions drawn per pool"""
+    template = tuple('' if char in PATTERN_CHARS else char for char in pattern)
+    slots: Dict[str, List[int]] = {}
+    for pos, char in enumerate(pattern):
+        if char in PATTERN_CHARS:
+            slots.setdefault(char, []).append(pos)
+    return template, tuple((char, tuple(positions)) for char, positions in slots.items())
 
 class PasswordGenerator:
     """Generate secure passwords with customizable rules"""
@@ -20,21 +89,103 @@ class PasswordGenerator:
         self.symbols = "!@#$%^&*()_+-=[]{}|;:,.<>?"
         
         # Word lists for memorable passwords
-        self.adjectives = [
+        self.adjectives = (
             "happy", "brave", "quick", "smart", "bright", "strong", "swift", "bold",
             "fierce", "gentle", "mighty", "noble", "proud", "royal", "sharp", "wise"
-        ]
+        )
         
-        self.nouns = [
+        self.nouns = (
             "eagle", "tiger", "mountain", "ocean", "thunder", "lightning", "dragon",
             "phoenix", "warrior", "hunter", "guardian", "champion", "legend", "hero"
-        ]
+        )
         
-        self.verbs = [
+        self.verbs = (
             "runs", "flies", "jumps", "fights", "guards", "protects", "strikes",
             "soars", "climbs", "dives", "hunts", "explores", "conquers", "defends"
-        ]
+        )
+        
+        # Memorable passwords cycle adjective, noun, verb
+        self._memorable_buckets = (self.adjectives, self.nouns, self.verbs)
         
+        # Extended word list for passphrases
+        self.passphrase_words = self.adjectives + self.nouns + (
+            "book", "tree", "river", "cloud", "star", "moon", "sun",
+            "fire", "water", "earth", "wind", "stone", "crystal",
+            "shadow", "light", "dream", "spirit", "heart", "soul"
+        )
+        
+        # Capitalized forms of every word list, so generation never re-capitalizes
+        self._memorable_buckets_cap = tuple(
+            tuple(word.capitalize() for word in bucket) for bucket in self._memorable_buckets
+        )
+        self._passphrase_words_cap = tuple(word.capitalize() for word in self.passphrase_words)
+        
+        # Byte -> class bit table (1=lower, 2=upper, 4=digit, 8=symbol) and
+        # the charset size / log2 for each of the 16 class masks
+        table = bytearray(256)
+        for bit, chars in ((1, self.lowercase), (2, self.uppercase),
+                           (4, self.digits), (8, self.symbols)):
+            for c in chars:
+                table[ord(c)] = bit
+        self._class_table = bytes(table)
+        sizes = (26, 26, 10, len(self.symbols))
+        self._mask_charset = tuple(
+            sum(size for i, size in enumerate(sizes) if mask >> i & 1) for mask in range(16)
+        )
+        self._mask_log2 = tuple(log2(size) if size else 0 for size in self._mask_charset)
+        
+        # Pools for generate_custom_pattern, keyed by pattern character
+        self._alnum = self.lowercase + self.uppercase + self.digits
+        self._all = self._alnum + self.symbols
+        self._pattern_pools = {
+            'l': self.lowercase, 'L': self.uppercase, 'd': self.digits,
+            's': self.symbols, 'a': self._alnum, '*': self._all
+        }
+        
+        # Purpose -> (length, pattern, generator, kwargs, strength); the
+        # example is only generated for the purpose actually requested
+        self._suggestion_specs = {
+            "general": (16, "Random with all character types",
+                        self.generate_random, {"length": 16}, "Strong"),
+            "high_security": (24, "Random with all character types",
+                              self.generate_random, {"length": 24}, "Very Strong"),
+            "memorable": (20, "Word combination with numbers and symbols",
+                          self.generate_memorable, {}, "Strong"),
+            "passphrase": (30, "Multiple words separated by hyphens",
+                           self.generate_passphrase, {}, "Very Strong"),
+            "pin": (6, "Digits only", self.generate_random,
+                    {"length": 6, "use_lowercase": False, "use_uppercase": False,
+                     "use_symbols": False}, "Weak (for PINs only)")
+        }
+        
+        # Character pools for every option combination, built once
+        # Key: (lowercase, uppercase, digits, symbols, exclude_ambiguous)
+        self._pools = {
+            key: self._build_pool(*key) for key in product((False, True), repeat=5)
+        }
+        
+    def _build_pool(self, use_lowercase: bool, use_uppercase: bool,
+                    use_digits: bool, use_symbols: bool,
+                    exclude_ambiguous: bool) -> Tuple[str, Tuple[Tuple[int, str], ...]]:
+        """Return the combined pool and (class bit, chars) per category for one option set"""
+        categories = []
+        for enabled, bit, chars in ((use_lowercase, 1, self.lowercase),
+                                    (use_uppercase, 2, self.uppercase),
+                                    (use_digits, 4, self.digits)):
+            if enabled:
+                categories.append((bit, chars.translate(AMBIGUOUS_TABLE) if exclude_ambiguous else chars))
+        if use_symbols:
+            categories.append((8, self.symbols))
+        return ''.join(chars for _, chars in categories), tuple(categories)
+    
+    def _choices(self, seq: Sequence, k: int) -> list:
+        """Pick k items from seq with replacement using one bulk index draw"""
+        return [seq[i] for i in secure_indices(len(seq), k)]
+    
+    def _draw(self, pool: str, n: int) -> str:
+        """Draw n characters from pool with a single bulk CSPRNG read"""
+        return ''.join(self._choices(pool, n))
+    
     def generate_random(self, length: int = 16, 
                        use_lowercase: bool = True,
                        use_uppercase: bool = True,
@@ -47,53 +198,41 @@ class PasswordGenerator:
         if length < 4:
             raise ValueError("Password length must be at least 4 characters")
         
-        # Build character pool
-        char_pool = ""
-        required_chars = []
-        
-        if use_lowercase:
-            chars = self.lowercase
-            if exclude_ambiguous:
-                chars = chars.replace('l', '').replace('o', '')
-            char_pool += chars
-            required_chars.append(secrets.choice(chars))
-            
-        if use_uppercase:
-            chars = self.uppercase
-            if exclude_ambiguous:
-                chars = chars.replace('O', '').replace('I', '')
-            char_pool += chars
-            required_chars.append(secrets.choice(chars))
-            
-        if use_digits:
-            chars = self.digits
-            if exclude_ambiguous:
-                chars = chars.replace('0', '').replace('1', '')
-            char_pool += chars
-            required_chars.append(secrets.choice(chars))
-            
-        if use_symbols:
-            char_pool += self.symbols
-            required_chars.append(secrets.choice(self.symbols))
+        # Look up the precomputed character pool
+        char_pool, categories = self._pools[(bool(use_lowercase), bool(use_uppercase),
+                                             bool(use_digits), bool(use_symbols),
+                                             bool(exclude_ambiguous))]
         
-        # Remove excluded characters
-        for char in exclude_chars:
-            char_pool = char_pool.replace(char, '')
+        # Remove excluded characters, from the required categories as well
+        if exclude_chars:
+            table = str.maketrans('', '', exclude_chars)
+            char_pool = char_pool.translate(table)
+            categories = tuple((bit, chars.translate(table)) for bit, chars in categories)
         
         if not char_pool:
             raise ValueError("No characters available with the specified criteria")
         
-        # Generate password
-        # Ensure at least one character from each selected category
-        password = required_chars.copy()
-        
-        # Fill the rest randomly
-        remaining_length = length - len(password)
-        for _ in range(remaining_length):
-            password.append(secrets.choice(char_pool))
+        # Generate the whole password from a single bulk draw
+        password = [char_pool[i] for i in secure_indices(len(char_pool), length)]
+        
+        # Ensure at least one character from each selected category; a missing
+        # category overwrites a random position whose class has others left
+        class_table = self._class_table
+        counts = Counter(''.join(password).encode('ascii').translate(class_table))
+        for bit, chars in categories:
+            if not chars or counts[bit]:
+                continue
+            while True:
+                pos = secrets.randbelow(length)
+                replaced = class_table[ord(password[pos])]
+                if counts[replaced] > 1:
+                    break
+            counts[replaced] -= 1
+            counts[bit] += 1
+            password[pos] = secrets.choice(chars)
         
         # Shuffle to avoid predictable patterns
-        random.shuffle(password)
+        secure_shuffle(password)
         
         return ''.join(password)
     
@@ -106,35 +245,22 @@ class PasswordGenerator:
         if word_count < 2:
             word_count = 2
         
-        words = []
-        
-        # Create a pattern of words
-        for i in range(word_count):
-            if i % 3 == 0:
-                word = secrets.choice(self.adjectives)
-            elif i % 3 == 1:
-                word = secrets.choice(self.nouns)
-            else:
-                word = secrets.choice(self.verbs)
-            
-            if capitalize and i % 2 == 0:
-                word = word.capitalize()
-                
-            words.append(word)
+        # Create a pattern of words, capitalizing every other word from the first
+        plain = self._memorable_buckets
+        even = self._memorable_buckets_cap if capitalize else plain
+        words = [secrets.choice((plain if i & 1 else even)[i % 3]) for i in range(word_count)]
         
         password = ''.join(words)
         
         if add_numbers:
             # Add random 2-4 digit number
             num_digits = secrets.choice([2, 3, 4])
-            number = ''.join([str(secrets.randbelow(10)) for _ in range(num_digits)])
-            password += number
+            password += self._draw(self.digits, num_digits)
         
         if add_symbols:
             # Add 1-2 random symbols
             num_symbols = secrets.choice([1, 2])
-            symbols = ''.join([secrets.choice(self.symbols) for _ in range(num_symbols)])
-            password += symbols
+            password += self._draw(self.symbols, num_symbols)
         
         return password
     
@@ -146,55 +272,50 @@ class PasswordGenerator:
         consonants = 'bcdfghjklmnpqrstvwxyz'
         vowels = 'aeiou'
         
-        password = ""
+        target_len = max(0, length - (4 if add_numbers else 0) - (2 if add_symbols else 0))
+        parts: List[str] = []
+        built = 0
+        
+        # Every syllable but the last is at least 2 letters, so these bulk draws
+        # bound the loop; no more letters than target_len are ever needed
+        max_syllables = target_len // 2 + 1
+        syllable_patterns = ('cv', 'cvc', 'vc')
+        patterns = secure_indices(3, max_syllables)
+        capitals = secure_indices(3, max_syllables)
+        letters = {'c': iter(self._draw(consonants, target_len)),
+                   'v': iter(self._draw(vowels, target_len))}
         
         # Create syllables (consonant-vowel or consonant-vowel-consonant patterns)
-        while len(password) < length - (4 if add_numbers else 0) - (2 if add_symbols else 0):
-            pattern = secrets.choice(['cv', 'cvc', 'vc'])
-            syllable = ""
-            
-            for char in pattern:
-                if char == 'c':
-                    syllable += secrets.choice(consonants)
-                else:  # vowel
-                    syllable += secrets.choice(vowels)
+        for pattern_index, capital in zip(patterns, capitals):
+            if built >= target_len:
+                break
+            # Cut the final syllable's pattern to fit instead of trimming drawn letters
+            pattern = syllable_patterns[pattern_index][:target_len - built]
+            syllable = ''.join([next(letters[char]) for char in pattern])
             
             # Occasionally capitalize
-            if len(password) == 0 or secrets.randbelow(3) == 0:
+            if built == 0 or capital == 0:
                 syllable = syllable.capitalize()
                 
-            password += syllable
-        
-        # Trim to exact length
-        password = password[:length - (4 if add_numbers else 0) - (2 if add_symbols else 0)]
+            parts.append(syllable)
+            built += len(pattern)
         
         if add_numbers:
-            password += ''.join([str(secrets.randbelow(10)) for _ in range(4)])
+            parts.append(self._draw(self.digits, 4))
         
         if add_symbols:
-            password += ''.join([secrets.choice(self.symbols) for _ in range(2)])
+            parts.append(self._draw(self.symbols, 2))
         
-        return password
+        return ''.join(parts)
     
     def generate_passphrase(self, word_count: int = 6, 
                            separator: str = "-",
                            capitalize_words: bool = False) -> str:
         """Generate a passphrase using random words"""
         
-        # Extended word list for passphrases
-        word_list = (self.adjectives + self.nouns + 
-                    ["book", "tree", "river", "cloud", "star", "moon", "sun",
-                     "fire", "water", "earth", "wind", "stone", "crystal",
-                     "shadow", "light", "dream", "spirit", "heart", "soul"])
-        
-        words = []
-        for _ in range(word_count):
-            word = secrets.choice(word_list)
-            if capitalize_words:
-                word = word.capitalize()
-            words.append(word)
-        
-        return separator.join(words)
+        word_list = self._passphrase_words_cap if capitalize_words else self.passphrase_words
+        
+        return separator.join(self._choices(word_list, word_count))
     
     def generate_custom_pattern(self, pattern: str) -> str:
         """
@@ -209,100 +330,94 @@ class PasswordGenerator:
         Example: "LLLLdddd!!" generates like "ABCD1234!!"
         """
         
-        password = ""
-        
-        for char in pattern:
-            if char == 'l':
-                password += secrets.choice(self.lowercase)
-            elif char == 'L':
-                password += secrets.choice(self.uppercase)
-            elif char == 'd':
-                password += secrets.choice(self.digits)
-            elif char == 's':
-                password += secrets.choice(self.symbols)
-            elif char == 'a':
-                password += secrets.choice(self.lowercase + self.uppercase + self.digits)
-            elif char == '*':
-                password += secrets.choice(self.lowercase + self.uppercase + 
-                                          self.digits + self.symbols)
-            else:
-                # Literal character
-                password += char
+        template, slots = _compile_pattern(pattern)
+        password = list(template)
         
-        return password
+        # One bulk draw per pool fills every position that pool owns
+        for char, positions in slots:
+            pool = self._pattern_pools[char]
+            for pos, index in zip(positions, secure_indices(len(pool), len(positions))):
+                password[pos] = pool[index]
+        
+        return ''.join(password)
     
     def batch_generate(self, count: int = 5, **kwargs) -> List[str]:
         """Generate multiple passwords with the same criteria"""
         
-        passwords = []
-        for _ in range(count):
-            passwords.append(self.generate_random(**kwargs))
+        return [self.generate_random(**kwargs) for _ in range(count)]
+    
+    def generate_spec_batch(self, specs: Sequence[Tuple[str, tuple, Dict]],
+                            return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """
+        Generate one password per (kind, args, kwargs) spec, preserving order
+        kind names a generate_* method, e.g. ('memorable', (), {'word_count': 4})
+        With return_exceptions=True a failing spec yields its exception in place of a password
+        """
         
-        return passwords
+        # Resolve every method first so a bad spec fails before any generation
+        methods = []
+        for kind, args, kwargs in specs:
+            method = getattr(self, f"generate_{kind}", None)
+            if method is None:
+                error = ValueError(f"Unknown password kind: {kind}")
+                if not return_exceptions:
+                    raise error
+                method = error
+            methods.append((method, args, kwargs))
+        
+        if not return_exceptions:
+            return [method(*args, **kwargs) for method, args, kwargs in methods]
+        
+        results = []
+        for method, args, kwargs in methods:
+            if isinstance(method, Exception):
+                results.append(method)
+                continue
+            try:
+                results.append(method(*args, **kwargs))
+            except Exception as e:
+                results.append(e)
+        return results
     
     def get_password_suggestions(self, purpose: str = "general") -> Dict:
         """Get password suggestions based on purpose"""
         
-        suggestions = {
-            "general": {
-                "length": 16,
-                "pattern": "Random with all character types",
-                "example": self.generate_random(16),
-                "strength": "Strong"
-            },
-            "high_security": {
-                "length": 24,
-                "pattern": "Random with all character types",
-                "example": self.generate_random(24),
-                "strength": "Very Strong"
-            },
-            "memorable": {
-                "length": 20,
-                "pattern": "Word combination with numbers and symbols",
-                "example": self.generate_memorable(),
-                "strength": "Strong"
-            },
-            "passphrase": {
-                "length": 30,
-                "pattern": "Multiple words separated by hyphens",
-                "example": self.generate_passphrase(),
-                "strength": "Very Strong"
-            },
-            "pin": {
-                "length": 6,
-                "pattern": "Digits only",
-                "example": self.generate_random(6, use_lowercase=False, 
-                                               use_uppercase=False, 
-                                               use_symbols=False),
-                "strength": "Weak (for PINs only)"
-            }
-        }
+        # Unknown purposes fall back to the general suggestion
+        spec = self._suggestion_specs.get(purpose) or self._suggestion_specs["general"]
+        length, pattern, generate, kwargs, strength = spec
         
-        return suggestions.get(purpose, suggestions["general"])
+        return {
+            "length": length,
+            "pattern": pattern,
+            "example": generate(**kwargs),
+            "strength": strength
+        }
     
     def estimate_strength(self, password: str) -> Dict:
         """Quick strength estimation for generated passwords"""
         
         length = len(password)
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_symbol = any(c in self.symbols for c in password)
-        
-        # Calculate charset size
-        charset_size = 0
-        if has_lower:
-            charset_size += 26
-        if has_upper:
-            charset_size += 26
-        if has_digit:
-            charset_size += 10
-        if has_symbol:
-            charset_size += len(self.symbols)
-        
-        # Calculate entropy
-        import math
-        entropy = length * math.log2(charset_size) if charset_size > 0 else 0
+        
+        mask = 0
+        if password.isascii():
+            # Classify every character in one C-level translate pass
+            for bits in set(password.encode('ascii').translate(self._class_table)):
+                mask |= bits
+        else:
+            # Non-ASCII letters and digits are outside the byte table; use the str checks
+            for c in password:
+                if c.islower():
+                    mask |= 1
+                elif c.isupper():
+                    mask |= 2
+                elif c.isdigit():
+                    mask |= 4
+                elif c in self.symbols:
+                    mask |= 8
+        
+        # Calculate charset size and entropy from the class mask
+        charset_size = self._mask_charset[mask]
+        entropy = length * self._mask_log2[mask]
         
         # Determine strength
         if entropy >= 60:
@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures for SecurePass Analyzer tests
+"""
+
+import random
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from password_generator import PasswordGenerator
+
+# Generator tests check structure, not unpredictability, so generation runs on a
+# seeded userspace PRNG instead of drawing OS entropy
+TEST_SEED = 42
+
+# generate_random configurations pre-generated once into password_pool
+POOL_SIZE = 10
+POOL_CONFIGS = {
+    "default12": (12, {}),
+    "mixed16": (16, dict(use_lowercase=True, use_uppercase=True,
+                         use_digits=True, use_symbols=True)),
+    "lowercase10": (10, dict(use_lowercase=True, use_uppercase=False,
+                             use_digits=False, use_symbols=False))
+}
+
+
+@contextmanager
+def patched_secrets(rng: random.Random):
+    """Reseed rng and route password_generator's secrets calls through it"""
+    rng.seed(TEST_SEED)
+    with patch('password_generator.secrets', SimpleNamespace(
+        token_bytes=rng.randbytes,
+        choice=rng.choice,
+        randbelow=rng.randrange
+    )):
+        yield rng
+
+
+@pytest.fixture(scope="session")
+def generator():
+    """One PasswordGenerator shared by every test module; generation does not mutate it"""
+    return PasswordGenerator()
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """Seeded PRNG backing seeded_secrets"""
+    return random.Random(TEST_SEED)
+
+
+@pytest.fixture
+def seeded_secrets(rng):
+    """Patch the generator's secrets module with the PRNG, reseeded for every test"""
+    with patched_secrets(rng):
+        yield rng
+
+
+@pytest.fixture(scope="session")
+def password_pool(generator, rng):
+    """POOL_SIZE passwords per POOL_CONFIGS entry, generated once for all tests"""
+    with patched_secrets(rng):
+        return {
+            name: [generator.generate_random(length, **options) for _ in range(POOL_SIZE)]
+            for name, (length, options) in POOL_CONFIGS.items()
+        }
@@ -1,49 +1,34 @@
 """
 Test runner for SecurePass Analyzer
-Executes all unit tests and provides coverage information
+Executes all unit tests with pytest
 """
 
-import unittest
 import sys
 import os
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+# pytest.ini's pythonpath puts src on the import path for every test module
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def run_all_tests():
-    """Run all unit tests and display results"""
-    # Discover and run all tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.dirname(__file__)
-    suite = loader.discover(start_dir, pattern='test_*.py')
+def run_all_tests(parallel: bool = True) -> bool:
+    """
+    Run the tests with pytest, across processes when pytest-xdist is installed
+    Exits with an error when pytest is not installed (see requirements-dev.txt)
+    """
+    try:
+        import pytest
+    except ImportError:
+        sys.exit("pytest is required to run the tests: pip install -r requirements-dev.txt")
     
-    # Run tests with verbose output
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Print summary
-    print("\n" + "="*50)
-    print("TEST SUMMARY")
-    print("="*50)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print("\nFAILURES:")
-        for test, traceback in result.failures:
-            print(f"- {test}: {traceback}")
-    
-    if result.errors:
-        print("\nERRORS:")
-        for test, traceback in result.errors:
-            print(f"- {test}: {traceback}")
-    
-    success_rate = ((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100) if result.testsRun > 0 else 0
-    print(f"\nSuccess rate: {success_rate:.1f}%")
-    
-    return result.wasSuccessful()
+    args = ['-q', TESTS_DIR]
+    if parallel:
+        try:
+            import xdist  # noqa: F401
+            # Processes, not threads: the tests patch shared globals such as requests.Session.get
+            args = ['-n', 'auto'] + args
+        except ImportError:
+            pass
+    return pytest.main(args) == 0
 
 if __name__ == '__main__':
-    success = run_all_tests()
+    success = run_all_tests(parallel='--serial' not in sys.argv)
     sys.exit(0 if success else 1)
@@ -2,15 +2,50 @@
 Unit tests for breach_checker module
 """
 
+import io
 import unittest
-import sys
 import os
+import tempfile
+from typing import Tuple
 from unittest.mock import Mock, patch
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from urllib3 import HTTPResponse
 
-from breach_checker import BreachChecker
+from breach_checker import RANGE_CACHE_TTL, BreachChecker, HashBloomFilter, RateLimiter
+
+# Uppercase SHA-1 digests of "password" and "123456", as sent to the HIBP range API
+SHA1_PASSWORD = "5BAA61E4C9B93F3F0682250B6CF8331B7EE68FD8"
+SHA1_123456 = "7C4A8D09CA3762AF61E59520943DC26494F8941B"
+
+
+# Canned API responses; each factory returns fresh Mocks so no call state leaks between tests
+def range_response() -> Mock:
+    """Range listing that does not contain the hash of "test" """
+    return Mock(status_code=200, content=b"00F9E393C8308B858A9EAAF6E308CBC5E5F6:2\r\n001E5C5B87D4F21F76A7500E6A2B39F8FB1A:3\r\n")
+
+
+def password_range_response() -> Mock:
+    """Range listing containing the hash of "password" """
+    return Mock(status_code=200, content=b"1E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493")
+
+
+def status_response(status_code: int) -> Mock:
+    """Bare response with only a status code"""
+    return Mock(status_code=status_code)
+
+
+def range_rate_limited() -> Tuple[Mock, ...]:
+    """Two 429s, without and with Retry-After, then the "password" range"""
+    return (
+        Mock(status_code=429, headers={}),
+        Mock(status_code=429, headers={'Retry-After': '4'}),
+        password_range_response()
+    )
+
+
+def email_rate_limited() -> Tuple[Mock, ...]:
+    """One 429 with Retry-After, then no breaches found"""
+    return (Mock(status_code=429, headers={'Retry-After': '2'}), status_response(404))
 
 
 class TestBreachChecker(unittest.TestCase):
@@ -27,14 +62,11 @@ class TestBreachChecker(unittest.TestCase):
         self.assertTrue(self.checker.hibp_breach_api)
         self.assertIn('User-Agent', self.checker.headers)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_password_breach_check_found(self, mock_get):
         """Test password breach checking when password is found"""
         # Mock response for a breached password
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "00F9E393C8308B858A9EAAF6E308CBC5E5F6:2\r\n001E5C5B87D4F21F76A7500E6A2B39F8FB1A:3\r\n"
-        mock_get.return_value = mock_response
+        mock_get.return_value = range_response()
         
         # Test with a password that would match the second hash
         is_breached, count = self.checker.check_password_breach("test")
@@ -44,14 +76,11 @@ class TestBreachChecker(unittest.TestCase):
         self.assertIsInstance(is_breached, bool)
         self.assertIsInstance(count, int)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_password_breach_check_not_found(self, mock_get):
         """Test password breach checking when password is not found"""
         # Mock response for a non-breached password
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = "00F9E393C8308B858A9EAAF6E308CBC5E5F6:2\r\n001E5C5B87D4F21F76A7500E6A2B39F8FB1A:3\r\n"
-        mock_get.return_value = mock_response
+        mock_get.return_value = range_response()
         
         # The password hash won't match our mock data
         is_breached, count = self.checker.check_password_breach("verysecurepassword123!")
@@ -59,13 +88,11 @@ class TestBreachChecker(unittest.TestCase):
         self.assertIsInstance(is_breached, bool)
         self.assertEqual(count, 0)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_password_breach_api_error(self, mock_get):
         """Test handling of API errors"""
         # Mock API error response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
+        mock_get.return_value = status_response(500)
         
         is_breached, count = self.checker.check_password_breach("test")
         
@@ -73,6 +100,155 @@ class TestBreachChecker(unittest.TestCase):
         self.assertFalse(is_breached)
         self.assertEqual(count, 0)
     
+    def test_offline_index_skips_network_for_unknown_hashes(self):
+        """Test the Bloom filter pre-check, including a save/load round trip"""
+        breached = [SHA1_PASSWORD, SHA1_123456]
+        with tempfile.TemporaryDirectory() as tmp:
+            hash_file = os.path.join(tmp, 'pwned.txt')
+            with open(hash_file, 'w', encoding='ascii') as f:
+                f.write(''.join(f"{h}:10\n" for h in breached))
+            
+            index_file = os.path.join(tmp, 'pwned.bloom')
+            HashBloomFilter.from_hash_file(hash_file).save(index_file)
+            bloom = HashBloomFilter.load(index_file)
+            for sha1_hash in breached:
+                self.assertIn(sha1_hash, bloom)
+            
+            session = Mock()
+            session.get.return_value = Mock(status_code=200, content=f"{breached[0][5:]}:10".encode())
+            checker = BreachChecker(session=session, offline_index=bloom)
+            
+            self.assertEqual(checker.check_password_breach("MyS3cur3P@ssw0rd2024!"), (False, 0))
+            session.get.assert_not_called()
+            self.assertEqual(checker.check_password_breach("password"), (True, 10))
+            session.get.assert_called_once()
+            del bloom, checker
+    
+    def test_rate_limit_tokens_only_for_network_lookups(self):
+        """Test Bloom-filter negatives and cached prefixes never take a rate-limit token"""
+        bloom = HashBloomFilter.for_capacity(1000, error_rate=1e-9)
+        bloom.add(SHA1_PASSWORD)
+        session = Mock()
+        session.get.return_value = password_range_response()
+        checker = BreachChecker(session=session, offline_index=bloom)
+        
+        with patch.object(checker.rate_limiter, 'acquire') as mock_acquire:
+            results = checker.batch_check_passwords([f"unbreached-{i}" for i in range(200)])
+            self.assertFalse(any(result['is_breached'] for result in results))
+            mock_acquire.assert_not_called()
+            session.get.assert_not_called()
+            
+            # A positive goes to the network once; the repeat is served from the range cache
+            self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+            self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+            mock_acquire.assert_called_once()
+            session.get.assert_called_once()
+    
+    def test_password_breach_check_caches_ranges_by_prefix(self):
+        """Test repeated lookups reuse the cached range but API errors are not cached"""
+        session = Mock()
+        session.get.return_value = Mock(
+            status_code=200,
+            content=b"1E4C9B93F3F0682250B6CF8331B7EE68FD8:3861493\r\n00F9E393C8308B858A9EAAF6E308CBC5E5F6:2"
+        )
+        checker = BreachChecker(session=session)
+        
+        self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+        self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+        session.get.assert_called_once()
+        
+        # Failed responses are retried on the next lookup
+        checker.clear_cache()
+        session.get.return_value = Mock(status_code=503)
+        self.assertEqual(checker.check_password_breach("password"), (False, 0))
+        self.assertEqual(checker.check_password_breach("password"), (False, 0))
+        self.assertEqual(session.get.call_count, 3)
+    
+    def test_cached_ranges_expire_and_are_bounded(self):
+        """Test cached ranges are refetched after RANGE_CACHE_TTL and evicted beyond RANGE_CACHE_SIZE"""
+        session = Mock()
+        session.get.return_value = password_range_response()
+        checker = BreachChecker(session=session)
+        
+        with patch('time.monotonic', return_value=1000.0) as mock_clock:
+            checker.check_password_breach("password")
+            mock_clock.return_value += RANGE_CACHE_TTL - 1
+            checker.check_password_breach("password")
+            session.get.assert_called_once()
+            
+            mock_clock.return_value += 2
+            self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+            self.assertEqual(session.get.call_count, 2)
+        
+        with patch('breach_checker.RANGE_CACHE_SIZE', 1):
+            checker.check_password_breach("test")
+            checker.check_password_breach("password")
+        self.assertEqual(session.get.call_count, 4)
+    
+    @patch('time.sleep')
+    def test_password_breach_check_retries_on_rate_limit(self, mock_sleep):
+        """Test range lookups wait out 429 responses instead of sleeping unconditionally"""
+        session = Mock()
+        session.get.side_effect = range_rate_limited()
+        checker = BreachChecker(session=session)
+        
+        self.assertEqual(checker.check_password_breach("password"), (True, 3861493))
+        self.assertEqual(session.get.call_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.5, 4.0])
+    
+    @patch('time.sleep')
+    def test_rate_limit_wait_is_validated_and_capped(self, mock_sleep):
+        """Test malformed Retry-After headers fall back to backoff and waits stay within bounds"""
+        session = Mock()
+        session.get.side_effect = [
+            Mock(status_code=429, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}),
+            Mock(status_code=429, headers={'Retry-After': '-5'}),
+            Mock(status_code=429, headers={'Retry-After': '86400'}),
+            Mock(status_code=429, headers={'Retry-After': 'nan'}),
+            Mock(status_code=200, content=b"")
+        ]
+        checker = BreachChecker(session=session)
+        
+        self.assertEqual(checker.check_password_breach("password"), (False, 0))
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [1.5, 0.0, 30.0, 12.0])
+    
+    def test_password_breach_check_uses_session(self):
+        """Test that a provided session is used for lookups and left open"""
+        session = Mock()
+        session.get.return_value = Mock(status_code=200, content=b"")
+        
+        with BreachChecker(session=session) as checker:
+            is_breached, count = checker.check_password_breach("test")
+        
+        session.get.assert_called_once()
+        session.close.assert_not_called()
+        self.assertFalse(is_breached)
+        self.assertEqual(count, 0)
+    
+    def test_default_session_is_pooled_and_closed(self):
+        """Test the checker creates its own retrying session and closes it on exit"""
+        with BreachChecker() as checker:
+            adapter = checker.session.get_adapter(checker.hibp_password_api)
+            self.assertIn(503, adapter.max_retries.status_forcelist)
+            self.assertNotIn(429, adapter.max_retries.status_forcelist)
+            
+            with patch.object(checker.session, 'close') as mock_close:
+                checker.close()
+                mock_close.assert_called_once()
+    
+    @patch('time.sleep')
+    def test_sustained_rate_limit_request_count(self, mock_sleep):
+        """Test sustained 429s through the default session cost one request per retry attempt"""
+        with patch('urllib3.connectionpool.HTTPConnectionPool._make_request',
+                   side_effect=lambda *args, **kwargs: HTTPResponse(io.BytesIO(), status=429, preload_content=False)
+                   ) as mock_request:
+            with BreachChecker() as checker:
+                self.assertEqual(checker.check_password_breach("password"), (False, 0))
+        
+        # Five attempts in _get_with_retry; the adapter does not retry 429s again
+        self.assertEqual(mock_request.call_count, 5)
+        self.assertEqual(mock_sleep.call_count, 4)
+    
     def test_email_breach_check_no_api_key(self):
         """Test email breach checking without API key"""
         result = self.checker.check_email_breaches("test@example.com")
@@ -81,18 +257,45 @@ class TestBreachChecker(unittest.TestCase):
         self.assertIn('API key required', result['error'])
         self.assertFalse(result['breached'])
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_email_breach_check_with_api_key(self, mock_get):
         """Test email breach checking with API key"""
         # Mock response for email not in breaches
+        mock_get.return_value = status_response(404)
+        
+        result = self.checker.check_email_breaches("test@example.com", "fake_api_key")
+        
+        self.assertFalse(result['breached'])
+        self.assertEqual(result['breach_count'], 0)
+        self.assertIsNone(result['error'])
+    
+    @patch('requests.Session.get')
+    def test_email_breach_check_parses_breaches(self, mock_get):
+        """Test breach listings are parsed from the raw response body"""
         mock_response = Mock()
-        mock_response.status_code = 404
+        mock_response.status_code = 200
+        mock_response.content = b'[{"Name": "Adobe", "Domain": "adobe.com", "BreachDate": "2013-10-04", "IsVerified": true}]'
         mock_get.return_value = mock_response
         
         result = self.checker.check_email_breaches("test@example.com", "fake_api_key")
         
+        self.assertTrue(result['breached'])
+        self.assertEqual(result['breach_count'], 1)
+        self.assertEqual(result['breaches'][0]['name'], "Adobe")
+        self.assertTrue(result['breaches'][0]['verified'])
+        self.assertIsNone(result['error'])
+    
+    @patch('time.sleep')
+    @patch('requests.Session.get')
+    def test_email_breach_check_retries_on_rate_limit(self, mock_get, mock_sleep):
+        """Test email breach checking waits out 429 responses using Retry-After"""
+        mock_get.side_effect = email_rate_limited()
+        
+        result = self.checker.check_email_breaches("test@example.com", "fake_api_key")
+        
+        self.assertEqual(mock_get.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
         self.assertFalse(result['breached'])
-        self.assertEqual(result['breach_count'], 0)
         self.assertIsNone(result['error'])
     
     def test_risk_level_calculation(self):
@@ -120,8 +323,9 @@ class TestBreachChecker(unittest.TestCase):
     @patch.object(BreachChecker, 'check_password_breach')
     def test_batch_check_passwords(self, mock_check):
         """Test batch password checking"""
-        # Mock the individual password check method
-        mock_check.side_effect = [(True, 100), (False, 0), (True, 10)]
+        # Mock the individual password check method (lookups run concurrently)
+        outcomes = {"weak1": (True, 100), "strong1": (False, 0), "weak2": (True, 10)}
+        mock_check.side_effect = outcomes.get
         
         passwords = ["weak1", "strong1", "weak2"]
         results = self.checker.batch_check_passwords(passwords)
@@ -131,12 +335,32 @@ class TestBreachChecker(unittest.TestCase):
         self.assertEqual(results[0]['exposure_count'], 100)
         self.assertFalse(results[1]['is_breached'])
         self.assertTrue(results[2]['is_breached'])
+        self.assertEqual(results[1]['password'], '•' * 7)
+        
+        # Masks can be left out entirely
+        results = self.checker.batch_check_passwords(passwords, include_mask=False)
+        self.assertNotIn('password', results[0])
+    
+    @patch('time.sleep')
+    def test_rate_limiter_blocks_when_window_full(self, mock_sleep):
+        """Test the rate limiter waits once max_rate calls fall in one window"""
+        limiter = RateLimiter(max_rate=2, time_period=60.0)
+        clock = iter([0.0, 1.0, 2.0, 61.0])
+        
+        with patch('time.monotonic', side_effect=lambda: next(clock)):
+            limiter.acquire()
+            limiter.acquire()
+            mock_sleep.assert_not_called()
+            limiter.acquire()
+        
+        mock_sleep.assert_called_once_with(58.0)
     
     @patch.object(BreachChecker, 'check_password_breach')
     def test_breach_statistics(self, mock_check):
         """Test breach statistics generation"""
         # Mock password check results
-        mock_check.side_effect = [(True, 1000), (False, 0), (True, 10), (False, 0)]
+        outcomes = {"pwd1": (True, 1000), "pwd2": (False, 0), "pwd3": (True, 10), "pwd4": (False, 0)}
+        mock_check.side_effect = outcomes.get
         
         passwords = ["pwd1", "pwd2", "pwd3", "pwd4"]
         stats = self.checker.get_breach_statistics(passwords)
@@ -146,6 +370,15 @@ class TestBreachChecker(unittest.TestCase):
         self.assertEqual(stats['safe_count'], 2)
         self.assertEqual(stats['breach_percentage'], 50.0)
         self.assertEqual(stats['total_exposures'], 1010)
+        self.assertEqual(stats['risk_distribution']['Safe'], 2)
+        self.assertEqual(stats['risk_distribution']['Critical Risk'], 1)
+        self.assertEqual(stats['risk_distribution']['High Risk'], 0)
+        
+        # Batch results are aggregated without checking the passwords again
+        mock_check.reset_mock()
+        results = self.checker.batch_check_passwords(passwords)
+        self.assertEqual(self.checker.get_breach_statistics(results), stats)
+        self.assertEqual(mock_check.call_count, 4)
     
     @patch.object(BreachChecker, 'check_password_breach')
     @patch.object(BreachChecker, 'check_email_breaches')
@@ -169,6 +402,8 @@ class TestBreachChecker(unittest.TestCase):
         self.assertIn('email_check', report)
         self.assertIn('recommendations', report)
         
+        self.assertRegex(report['timestamp'], r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+        
         # Check password check results
         self.assertTrue(report['password_check']['is_breached'])
         self.assertEqual(report['password_check']['exposure_count'], 500)
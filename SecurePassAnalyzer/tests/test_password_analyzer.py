@@ -3,11 +3,11 @@ Unit tests for password_analyzer module
 """
 
 import unittest
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+import math
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+import zxcvbn
 
 from password_analyzer import PasswordAnalyzer
 
@@ -48,6 +48,12 @@ class TestPasswordAnalyzer(unittest.TestCase):
         patterns = self.analyzer.check_patterns("password")
         self.assertTrue(patterns['common_word'])
     
+    def test_common_passwords_loaded_once(self):
+        """Test the common-password list is read from file and shared between analyzers"""
+        self.assertIsInstance(self.analyzer.common_passwords, frozenset)
+        self.assertIn('letmein', self.analyzer.common_passwords)
+        self.assertIs(PasswordAnalyzer().common_passwords, self.analyzer.common_passwords)
+    
     def test_character_diversity(self):
         """Test character diversity analysis"""
         # Test password with all character types
@@ -64,6 +70,26 @@ class TestPasswordAnalyzer(unittest.TestCase):
         self.assertFalse(diversity['has_numbers'])
         self.assertFalse(diversity['has_symbols'])
     
+    def test_character_classes_ascii_only(self):
+        """Test spaces are detected and non-ASCII characters count toward no class"""
+        diversity = self.analyzer.get_character_diversity("é€ 😀")
+        self.assertTrue(diversity['has_spaces'])
+        self.assertFalse(any(v for k, v in diversity.items() if k != 'has_spaces'))
+        self.assertEqual(self.analyzer.calculate_entropy("é€😀"), 0)
+        
+        # Entropy grows with each character class present
+        self.assertEqual(self.analyzer.calculate_entropy("aB3!"), round(4 * math.log2(94), 2))
+    
+    def test_bulk_entropy_matches_single(self):
+        """Test bulk entropy equals per-password entropy, with and without numpy"""
+        passwords = ["", "abc123", "P@ssW0rd!123", "é€ 😀", "correct horse battery staple", ""]
+        expected = [self.analyzer.calculate_entropy(p) for p in passwords]
+        
+        self.assertEqual(self.analyzer.calculate_entropy_bulk(passwords), expected)
+        with patch('password_analyzer.np', None):
+            self.assertEqual(self.analyzer.calculate_entropy_bulk(passwords), expected)
+        self.assertEqual(self.analyzer.calculate_entropy_bulk([]), [])
+    
     def test_score_calculation(self):
         """Test password score calculation"""
         # Very weak password
@@ -102,6 +128,52 @@ class TestPasswordAnalyzer(unittest.TestCase):
         # Check recommendations are provided
         self.assertIsInstance(analysis['recommendations'], list)
     
+    def test_long_password_analysis(self):
+        """Test passwords longer than zxcvbn's limit are still analyzed"""
+        password = "Tr0ub4dor&3-correct-horse-battery-staple-" * 3
+        analysis = self.analyzer.analyze(password)
+        
+        self.assertEqual(analysis['password_length'], len(password))
+        self.assertGreaterEqual(analysis['score'], 0)
+        self.assertLessEqual(analysis['score'], 100)
+    
+    def test_batch_analysis(self):
+        """Test batch analysis matches individual analysis and keeps order"""
+        passwords = ["password123", "TestP@ssw0rd123!", "qwerty"]
+        results = self.analyzer.batch_analyze(passwords)
+        
+        self.assertEqual(len(results), 3)
+        for password, result in zip(passwords, results):
+            self.assertEqual(result['score'], self.analyzer.analyze(password)['score'])
+            self.assertEqual(result['password_length'], len(password))
+        
+        # Same results when distributed over an executor
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = self.analyzer.batch_analyze(passwords, executor=executor)
+        self.assertEqual([r['score'] for r in threaded], [r['score'] for r in results])
+    
+    def test_analysis_keeps_no_password_state(self):
+        """Test each analysis runs zxcvbn once and nothing is retained between calls"""
+        first = self.analyzer.analyze("Tr0ub4dor&3x")
+        first['recommendations'].append("mutated")
+        
+        with patch('password_analyzer.zxcvbn.zxcvbn', wraps=zxcvbn.zxcvbn) as mock_zxcvbn:
+            second = self.analyzer.analyze("Tr0ub4dor&3x")
+            mock_zxcvbn.assert_called_once_with("Tr0ub4dor&3x")
+        self.assertNotIn("mutated", second['recommendations'])
+        
+        # No attribute of the analyzer holds the analyzed password
+        self.assertNotIn("Tr0ub4dor&3x", repr(vars(self.analyzer)))
+    
+    def test_parallel_bulk_analysis(self):
+        """Test process-pool analysis matches serial analysis and survives pickling"""
+        clone = pickle.loads(pickle.dumps(self.analyzer))
+        self.assertEqual(clone.analyze("qwerty")['score'], self.analyzer.analyze("qwerty")['score'])
+        
+        passwords = ["password123", "TestP@ssw0rd123!", "qwerty"]
+        results = self.analyzer.analyze_bulk_parallel(passwords, max_workers=2, chunksize=1)
+        self.assertEqual(results, [self.analyzer.analyze(p) for p in passwords])
+    
     def test_recommendations_generation(self):
         """Test recommendation generation"""
         # Test weak password gets recommendations
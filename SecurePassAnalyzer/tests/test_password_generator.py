@@ -2,165 +2,246 @@
 Unit tests for password_generator module
 """
 
-import unittest
-import sys
-import os
+import re
 import string
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from password_generator import PasswordGenerator
-
-
-class TestPasswordGenerator(unittest.TestCase):
-    """Test cases for PasswordGenerator class"""
-    
-    def setUp(self):
-        """Set up test fixtures"""
-        self.generator = PasswordGenerator()
-    
-    def test_random_password_generation(self):
-        """Test random password generation with various options"""
-        # Test basic generation
-        password = self.generator.generate_random(12)
-        self.assertEqual(len(password), 12)
-        
-        # Test with specific character types
-        password = self.generator.generate_random(
-            16, use_lowercase=True, use_uppercase=True,
-            use_digits=True, use_symbols=True
-        )
-        self.assertEqual(len(password), 16)
-        self.assertTrue(any(c.islower() for c in password))
-        self.assertTrue(any(c.isupper() for c in password))
-        self.assertTrue(any(c.isdigit() for c in password))
-        self.assertTrue(any(c in self.generator.symbols for c in password))
-        
-        # Test with only lowercase
-        password = self.generator.generate_random(
-            10, use_lowercase=True, use_uppercase=False,
-            use_digits=False, use_symbols=False
-        )
-        self.assertEqual(len(password), 10)
-        self.assertTrue(all(c.islower() for c in password))
-    
-    def test_memorable_password_generation(self):
-        """Test memorable password generation"""
-        password = self.generator.generate_memorable(word_count=3)
-        self.assertGreater(len(password), 0)
-        
-        # Test with specific options
-        password = self.generator.generate_memorable(
-            word_count=4, add_numbers=True, add_symbols=True, capitalize=True
-        )
-        self.assertGreater(len(password), 10)
-        self.assertTrue(any(c.isdigit() for c in password))
-        self.assertTrue(any(c in self.generator.symbols for c in password))
-    
-    def test_pronounceable_password_generation(self):
-        """Test pronounceable password generation"""
-        password = self.generator.generate_pronounceable(12)
-        self.assertGreaterEqual(len(password), 8)  # Might be slightly shorter due to syllable patterns
-        
-        # Test with numbers and symbols
-        password = self.generator.generate_pronounceable(
-            16, add_numbers=True, add_symbols=True
-        )
-        self.assertTrue(any(c.isdigit() for c in password))
-        self.assertTrue(any(c in self.generator.symbols for c in password))
-    
-    def test_passphrase_generation(self):
-        """Test passphrase generation"""
-        passphrase = self.generator.generate_passphrase(word_count=4)
-        self.assertGreater(len(passphrase), 0)
-        self.assertIn("-", passphrase)  # Default separator
-        
-        # Test with custom separator
-        passphrase = self.generator.generate_passphrase(
-            word_count=3, separator="_", capitalize_words=True
-        )
-        self.assertIn("_", passphrase)
-        # Should have at least one capitalized word
-        words = passphrase.split("_")
-        self.assertTrue(any(word[0].isupper() for word in words if word))
-    
-    def test_custom_pattern_generation(self):
-        """Test custom pattern generation"""
-        # Test basic pattern
-        password = self.generator.generate_custom_pattern("LLLLdddd")
-        self.assertEqual(len(password), 8)
-        self.assertTrue(password[:4].isupper())
-        self.assertTrue(password[4:].isdigit())
-        
-        # Test pattern with literals
-        password = self.generator.generate_custom_pattern("LLdd@@")
-        self.assertEqual(len(password), 6)
-        self.assertEqual(password[-2:], "@@")
-        
-        # Test mixed pattern
-        password = self.generator.generate_custom_pattern("Lldls*")
-        self.assertEqual(len(password), 6)
-        self.assertTrue(password[0].isupper())
-        self.assertTrue(password[1].islower())
-        self.assertTrue(password[2].isdigit())
-    
-    def test_batch_generation(self):
-        """Test batch password generation"""
-        passwords = self.generator.batch_generate(count=5, length=12)
-        self.assertEqual(len(passwords), 5)
-        
-        # All passwords should be unique
-        self.assertEqual(len(set(passwords)), 5)
-        
-        # All passwords should be the correct length
+import pytest
+
+from password_generator import secure_indices, secure_shuffle
+
+# Character classes for membership checks
+LOWER = frozenset(string.ascii_lowercase)
+UPPER = frozenset(string.ascii_uppercase)
+DIGITS = frozenset(string.digits)
+ALPHANUMERIC = LOWER | UPPER | DIGITS
+UPPER_PREFIXES = tuple(string.ascii_uppercase)
+
+# Expected shapes of custom pattern output
+PATTERN_LLLLDDDD = re.compile(r'^[A-Z]{4}\d{4}$')
+PATTERN_LLDD_LITERAL = re.compile(r'^[A-Z]{2}\d{2}@@$')
+PATTERN_MIXED = re.compile(r'^[A-Z][a-z]\d[a-z][^A-Za-z0-9].$')
+PATTERN_DIGIT_GROUPS = re.compile(r'^(\d-){5}\d$')
+
+# Every test draws from the seeded PRNG in conftest
+pytestmark = pytest.mark.usefixtures("seeded_secrets")
+
+
+@pytest.fixture(scope="module")
+def symbols(generator):
+    """The generator's symbols as a set"""
+    return frozenset(generator.symbols)
+
+
+@pytest.fixture(scope="module")
+def count_symbols(symbols):
+    """Count the generator's symbols in an ASCII password with one translate call"""
+    table = bytes(chr(b) in symbols for b in range(256))
+    return lambda password: password.encode('ascii').translate(table).count(1)
+
+
+def test_random_password_generation(password_pool, symbols):
+    """Test random password generation with various options"""
+    for name, length in (("default12", 12), ("mixed16", 16), ("lowercase10", 10)):
+        for password in password_pool[name]:
+            assert len(password) == length
+    
+    for mixed in password_pool["mixed16"]:
+        for char_class in (LOWER, UPPER, DIGITS, symbols):
+            assert not char_class.isdisjoint(mixed)
+    assert set(''.join(password_pool["lowercase10"])) <= LOWER
+
+
+def test_random_password_exclusions(generator):
+    """Test ambiguous and explicitly excluded characters are removed"""
+    for _ in range(20):
+        password = generator.generate_random(32, use_symbols=False, exclude_ambiguous=True)
+        assert not set(password) & set("loOI01")
+    
+    password = generator.generate_random(
+        40, use_uppercase=False, use_digits=False, use_symbols=False,
+        exclude_chars="abcdefghijklm"
+    )
+    assert not set(password) & set("abcdefghijklm")
+    
+    # Excluding a whole category drops it from the required characters
+    for _ in range(20):
+        password = generator.generate_random(4, exclude_chars=string.digits)
+        assert len(password) == 4
+        assert DIGITS.isdisjoint(password)
+
+
+def test_secure_indices():
+    """Test bulk index draws stay in range for small and large pools"""
+    for size in (1, 7, 26, 256, 300):
+        indices = secure_indices(size, 500)
+        assert len(indices) == 500
+        assert all(0 <= i < size for i in indices)
+    assert secure_indices(10, 0) == []
+    
+    # The shuffle is a permutation for small and large lists
+    for size in (0, 1, 5, 300):
+        items = list(range(size))
+        secure_shuffle(items)
+        assert sorted(items) == list(range(size))
+
+
+def test_memorable_password_generation(generator, count_symbols):
+    """Test memorable password generation"""
+    password = generator.generate_memorable(word_count=3)
+    assert len(password) > 0
+    
+    # Test with specific options
+    password = generator.generate_memorable(
+        word_count=4, add_numbers=True, add_symbols=True, capitalize=True
+    )
+    assert len(password) > 10
+    assert not DIGITS.isdisjoint(password)
+    assert count_symbols(password) in (1, 2)
+
+
+def test_pronounceable_password_generation(generator, count_symbols):
+    """Test pronounceable password generation"""
+    password = generator.generate_pronounceable(12)
+    assert len(password) >= 8
+    
+    # Test with numbers and symbols
+    password = generator.generate_pronounceable(16, add_numbers=True, add_symbols=True)
+    assert not DIGITS.isdisjoint(password)
+    assert count_symbols(password) == 2
+    
+    # The final syllable is cut to fit, so the length is exact
+    for length in range(6, 20):
+        assert len(generator.generate_pronounceable(length)) == length
+
+
+def test_passphrase_generation(generator):
+    """Test passphrase generation"""
+    passphrase = generator.generate_passphrase(word_count=4)
+    assert len(passphrase) > 0
+    assert "-" in passphrase  # Default separator
+    
+    # Test with custom separator
+    passphrase = generator.generate_passphrase(word_count=3, separator="_", capitalize_words=True)
+    assert "_" in passphrase
+    # Every word should be capitalized
+    assert all(word.startswith(UPPER_PREFIXES) for word in passphrase.split("_"))
+
+
+def test_custom_pattern_generation(generator):
+    """Test custom pattern generation"""
+    # Test basic pattern
+    assert PATTERN_LLLLDDDD.match(generator.generate_custom_pattern("LLLLdddd"))
+    
+    # Test pattern with literals
+    assert PATTERN_LLDD_LITERAL.match(generator.generate_custom_pattern("LLdd@@"))
+    
+    # Test mixed pattern
+    assert PATTERN_MIXED.match(generator.generate_custom_pattern("Lldls*"))
+    
+    # Repeated patterns reuse the compiled template but draw fresh characters
+    passwords = {generator.generate_custom_pattern("d-d-d-d-d-d") for _ in range(5)}
+    assert len(passwords) > 1
+    for password in passwords:
+        assert PATTERN_DIGIT_GROUPS.match(password)
+
+
+def test_batch_generation(generator):
+    """Test batch password generation"""
+    passwords = generator.batch_generate(count=5, length=12)
+    assert len(passwords) == 5
+    
+    # All passwords should be unique
+    assert len(set(passwords)) == 5
+    
+    # All passwords should be the correct length
+    assert all(len(password) == 12 for password in passwords)
+    
+    # Larger batches also stop at the first duplicate
+    for count in (100, 1000):
+        passwords = generator.batch_generate(count=count, length=12, use_symbols=False)
+        assert len(passwords) == count
+        seen = set()
         for password in passwords:
-            self.assertEqual(len(password), 12)
-    
-    def test_password_suggestions(self):
-        """Test password suggestions for different purposes"""
-        # Test general purpose
-        suggestion = self.generator.get_password_suggestions("general")
-        self.assertIn("length", suggestion)
-        self.assertIn("example", suggestion)
-        self.assertIn("strength", suggestion)
-        
-        # Test high security
-        suggestion = self.generator.get_password_suggestions("high_security")
-        self.assertGreater(suggestion["length"], 20)
-        
-        # Test memorable
-        suggestion = self.generator.get_password_suggestions("memorable")
-        self.assertIn("example", suggestion)
-    
-    def test_strength_estimation(self):
-        """Test quick strength estimation"""
-        # Test weak password
-        estimation = self.generator.estimate_strength("123456")
-        self.assertEqual(estimation["strength"], "Weak")
-        
-        # Test strong password
-        estimation = self.generator.estimate_strength("MyVerySecur3P@ssword!")
-        self.assertIn(estimation["strength"], ["Strong", "Very Strong"])
-        
-        # Check estimation includes required fields
-        required_fields = ["entropy", "strength", "charset_size", "length"]
-        for field in required_fields:
-            self.assertIn(field, estimation)
-    
-    def test_error_handling(self):
-        """Test error handling for invalid inputs"""
-        # Test minimum length requirement
-        with self.assertRaises(ValueError):
-            self.generator.generate_random(3)  # Too short
-        
-        # Test no character types selected
-        with self.assertRaises(ValueError):
-            self.generator.generate_random(
-                10, use_lowercase=False, use_uppercase=False,
-                use_digits=False, use_symbols=False
-            )
-
-
-if __name__ == '__main__':
-    unittest.main()
+            assert password not in seen
+            seen.add(password)
+        assert all(len(p) == 12 for p in passwords)
+        assert set(''.join(passwords)) <= ALPHANUMERIC
+
+
+def test_spec_batch_generation(generator):
+    """Test generating mixed password kinds from specs"""
+    passwords = generator.generate_spec_batch([
+        ('random', (12,), {}),
+        ('passphrase', (), {'word_count': 3, 'separator': '_'}),
+        ('custom_pattern', ('dddd',), {})
+    ])
+    assert len(passwords) == 3
+    assert len(passwords[0]) == 12
+    assert len(passwords[1].split('_')) == 3
+    assert set(passwords[2]) <= DIGITS
+    
+    # Unknown kinds are rejected
+    with pytest.raises(ValueError):
+        generator.generate_spec_batch([('nonexistent', (), {})])
+    
+    # With return_exceptions, failing specs are reported in place and the rest still generate
+    passwords = generator.generate_spec_batch([
+        ('nonexistent', (), {}),
+        ('random', (3,), {}),
+        ('custom_pattern', ('dddd',), {})
+    ], return_exceptions=True)
+    assert isinstance(passwords[0], ValueError)
+    assert isinstance(passwords[1], ValueError)
+    assert len(passwords[2]) == 4
+
+
+def test_password_suggestions(generator):
+    """Test password suggestions for different purposes"""
+    # Fetch each purpose once and assert against the stored dicts
+    suggestions = {purpose: generator.get_password_suggestions(purpose)
+                   for purpose in ("general", "high_security", "memorable", "unknown")}
+    
+    # Test general purpose
+    for key in ("length", "example", "strength"):
+        assert key in suggestions["general"]
+    
+    # Test high security
+    assert suggestions["high_security"]["length"] > 20
+    
+    # Test memorable
+    assert "example" in suggestions["memorable"]
+    
+    # Unknown purposes fall back to the general suggestion
+    assert suggestions["unknown"]["length"] == suggestions["general"]["length"]
+
+
+def test_strength_estimation(generator):
+    """Test quick strength estimation"""
+    # Test weak password
+    assert generator.estimate_strength("123456")["strength"] == "Weak"
+    
+    # Test strong password
+    estimation = generator.estimate_strength("MyVerySecur3P@ssword!")
+    assert estimation["strength"] in ["Strong", "Very Strong"]
+    
+    # Check estimation includes required fields
+    for field in ["entropy", "strength", "charset_size", "length"]:
+        assert field in estimation
+    
+    # Non-ASCII characters are classified like their ASCII counterparts
+    assert generator.estimate_strength("ÅØÆ")["charset_size"] == 26
+    assert generator.estimate_strength("pässwörd")["charset_size"] == 26
+    assert generator.estimate_strength("Ünïcödé1!") == generator.estimate_strength("Unicode1!")
+
+
+@pytest.mark.parametrize("args, kwargs, message", [
+    # Minimum length requirement
+    ((3,), {}, "at least 4 characters"),
+    # No character types selected
+    ((10,), dict(use_lowercase=False, use_uppercase=False,
+                 use_digits=False, use_symbols=False), "No characters available")
+])
+def test_error_handling(generator, args, kwargs, message):
+    """Test error handling for invalid inputs"""
+    with pytest.raises(ValueError, match=message):
+        generator.generate_random(*args, **kwargs)